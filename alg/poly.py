@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+import numpy as np
+from numpy import ndarray
+
+# The pairs of box cells (left to right, top to bottom) in each row
+ROWS = np.array([[0, 1], [2, 3]])
+
+
+class Term(NamedTuple):
+    """An integer monomial, ``coefficient * variable ** exponent``."""
+
+    coefficient: int
+    exponent: int
+
+    def latex(self, variable: str = "y") -> str:
+        if self.exponent == 0:
+            return str(self.coefficient)
+
+        coefficient = {1: "", -1: "-"}.get(self.coefficient, str(self.coefficient))
+        power = variable if self.exponent == 1 else f"{variable}^{self.exponent}"
+        return coefficient + power
+
+
+def term_gcds(
+    coefficients_a: Any, exponents_a: Any, coefficients_b: Any, exponents_b: Any
+) -> tuple[ndarray, ndarray]:
+    """Elementwise gcds of two arrays of terms, as ``(coefficients, exponents)``.
+
+    Each gcd takes the sign of its term from ``a``, so dividing that term
+    by it leaves a positive coefficient.
+    """
+
+    coefficients_a = np.asarray(coefficients_a, dtype=np.int64)
+    coefficients_b = np.asarray(coefficients_b, dtype=np.int64)
+    signs = np.where(coefficients_a < 0, -1, 1)
+    exponents = np.minimum(exponents_a, exponents_b)
+    return np.gcd(coefficients_a, coefficients_b) * signs, exponents
+
+
+class BoxFactors(NamedTuple):
+    """Box-method factorings of ``N`` four-term polynomials.
+
+    Shapes are ``(N, 2)`` for the gcds and ``(N,)`` for ``valid``, which is
+    whether every cell of the box is its row gcd times its column gcd (i.e.
+    whether the polynomial factors by grouping as it stands).
+    """
+
+    row_coefficients: ndarray
+    row_exponents: ndarray
+    column_coefficients: ndarray
+    column_exponents: ndarray
+    valid: ndarray
+
+
+def box_factor_many(coefficients: Any, exponents: Any = (3, 2, 1, 0)) -> BoxFactors:
+    """Factors ``N`` polynomials by grouping at once.
+
+    ``coefficients`` has shape ``(N, 4)``, ordered like the box cells;
+    ``exponents`` broadcasts against it.
+    """
+
+    coefficients = np.atleast_2d(np.asarray(coefficients, dtype=np.int64))
+    exponents = np.asarray(exponents, dtype=np.int64)
+    exponents = np.broadcast_to(exponents, coefficients.shape)
+
+    # The row gcds take their signs from the rows' first cells...
+    row_coefficients, row_exponents = term_gcds(
+        coefficients[:, ROWS[:, 0]],
+        exponents[:, ROWS[:, 0]],
+        coefficients[:, ROWS[:, 1]],
+        exponents[:, ROWS[:, 1]],
+    )
+
+    # ...and the column gcds are whatever makes the first row come out, so
+    # their signs agree with the rows' (0 only when the polynomial is invalid)
+    first_row = np.where(row_coefficients[:, :1] == 0, 1, row_coefficients[:, :1])
+    column_coefficients = coefficients[:, :2] // first_row
+    column_exponents = exponents[:, :2] - row_exponents[:, :1]
+
+    # Every cell has to be its row's gcd times its column's
+    cell_coefficients = (
+        row_coefficients[:, :, None] * column_coefficients[:, None, :]
+    ).reshape(-1, 4)
+    cell_exponents = (
+        row_exponents[:, :, None] + column_exponents[:, None, :]
+    ).reshape(-1, 4)
+    valid = (
+        (coefficients != 0).all(axis=1)
+        & (cell_coefficients == coefficients).all(axis=1)
+        & (cell_exponents == exponents).all(axis=1)
+    )
+
+    return BoxFactors(
+        row_coefficients, row_exponents, column_coefficients, column_exponents, valid
+    )
+
+
+class BoxFactoring(NamedTuple):
+    """A polynomial factored by grouping: ``(column gcds) * (row gcds)``."""
+
+    terms: tuple[Term, Term, Term, Term]
+    row_gcds: tuple[Term, Term]
+    column_gcds: tuple[Term, Term]
+
+    def latex(self, variable: str = "y") -> dict[str, tuple[str, ...]]:
+        """Everything the box-method scene writes out, as LaTeX math."""
+
+        def binomial(a: Term, b: Term) -> str:
+            sign = "+" if b.coefficient > 0 else ""
+            return f"({a.latex(variable)}{sign}{b.latex(variable)})"
+
+        return {
+            "terms": tuple(term.latex(variable) for term in self.terms),
+            "row_gcds": tuple(term.latex(variable) for term in self.row_gcds),
+            "column_gcds": tuple(term.latex(variable) for term in self.column_gcds),
+            "factors": (binomial(*self.column_gcds), binomial(*self.row_gcds)),
+        }
+
+
+@lru_cache(maxsize=4096)
+def box_factor(
+    coefficients: tuple[int, int, int, int],
+    exponents: tuple[int, int, int, int] = (3, 2, 1, 0),
+) -> BoxFactoring:
+    """Factors one polynomial by grouping.
+
+    Raises ``ValueError`` if it doesn't factor that way, e.g. because its
+    terms share a common factor that should be taken out first.
+    """
+
+    factors = box_factor_many([coefficients], [exponents])
+    if not factors.valid[0]:
+        raise ValueError(
+            f"{coefficients} with exponents {exponents} doesn't factor by grouping"
+        )
+
+    def terms(coefficients: ndarray, exponents: ndarray) -> tuple[Term, ...]:
+        return tuple(Term(int(c), int(e)) for c, e in zip(coefficients, exponents))
+
+    return BoxFactoring(
+        terms(np.asarray(coefficients), np.asarray(exponents)),
+        terms(factors.row_coefficients[0], factors.row_exponents[0]),
+        terms(factors.column_coefficients[0], factors.column_exponents[0]),
+    )
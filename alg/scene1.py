@@ -1,12 +1,59 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
 from manim import *
 
+from poly import box_factor
+
+
+class Problem(NamedTuple):
+    """A four-term polynomial factored by grouping with the box method.
+
+    Everything is LaTeX math (without the ``$``). ``terms`` fill the box
+    left to right, top to bottom; ``row_gcds`` label the rows and
+    ``column_gcds`` the columns, so the answer is ``factors[0]`` (the
+    columns) times ``factors[1]`` (the rows).
+    """
+
+    terms: tuple[str, str, str, str]
+    row_gcds: tuple[str, str]
+    column_gcds: tuple[str, str]
+    factors: tuple[str, str]
+
 
 class Main(MovingCameraScene):
+    problem = Problem(**box_factor((28, 16, -21, -12)).latex())
+
+    @classmethod
+    def with_problem(cls, problem: Problem | dict) -> type[Main]:
+        """The scene for another problem, e.g. one entry of a problem list.
+
+        Problems given as ``coefficients`` (and optionally ``exponents`` and
+        ``variable``) are factored with ``poly.box_factor``.
+        """
+
+        if isinstance(problem, dict) and "coefficients" in problem:
+            factoring = box_factor(
+                tuple(problem["coefficients"]),
+                tuple(problem.get("exponents", (3, 2, 1, 0))),
+            )
+            problem = Problem(**factoring.latex(problem.get("variable", "y")))
+        elif isinstance(problem, dict):
+            problem = Problem(**{key: tuple(value) for key, value in problem.items()})
+        return type(cls.__name__, (cls,), {"problem": problem})
 
     def construct(self):
-        expression = Tex(
-            "$28y^3$", " $+$ ", "$16y^2$", " ", "$-21y$", " ", "$-12$"
-        ).move_to(UP * 3 / 4)
+        terms = self.problem.terms
+        row_gcds = self.problem.row_gcds
+        column_gcds = self.problem.column_gcds
+        factors = self.problem.factors
+
+        # Negative terms carry their own sign
+        parts = [f"${terms[0]}$"]
+        for term in terms[1:]:
+            parts += [" " if term.startswith("-") else " $+$ ", f"${term}$"]
+        expression = Tex(*parts).move_to(UP * 3 / 4)
         box = (
             VGroup(
                 Square(side_length=1.25),
@@ -28,12 +75,13 @@ class Main(MovingCameraScene):
                 expression[i * 2].animate.move_to(box[i]),
             )
 
-        self.remove(expression[1])
-        self.play(FadeOut(expression[1]))
+        signs = [expression[1], expression[3], expression[5]]
+        self.remove(*signs)
+        self.play(FadeOut(*signs))
 
         expression = VGroup(expression[0], expression[2], expression[4], expression[6])
 
-        # get gcd (28y^3, 16y^2)
+        # get gcd of the first row
         gcd1 = VGroup(expression[1]).copy()
         gcd0 = VGroup(expression[0]).copy()
         gcd_label = Tex("gcd")
@@ -42,15 +90,17 @@ class Main(MovingCameraScene):
         self.play(FadeIn(gcd_label.next_to(gcd0, LEFT)))
 
         group = VGroup(gcd1, gcd0, gcd_label)
-        aligned_group = Tex("$=$gcd($28y^3$, $16y^2$)").next_to(box[0], LEFT)
+        aligned_group = Tex(f"$=$gcd(${terms[0]}$, ${terms[1]}$)").next_to(
+            box[0], LEFT
+        )
         self.play(ReplacementTransform(group, aligned_group))
         self.wait(1)
 
-        gcd_result_1 = Tex("$4y^2$").next_to(box[0], LEFT)
+        gcd_result_1 = Tex(f"${row_gcds[0]}$").next_to(box[0], LEFT)
         self.play(ReplacementTransform(aligned_group, gcd_result_1))
         self.wait(1)
 
-        # get gcd (-21y, -12)
+        # get gcd of the second row
         gcd3 = VGroup(expression[3]).copy()
         gcd2 = VGroup(expression[2]).copy()
         gcd_label = Tex("gcd")
@@ -59,15 +109,17 @@ class Main(MovingCameraScene):
         self.play(FadeIn(gcd_label.next_to(gcd2, LEFT)))
 
         group = VGroup(gcd3, gcd2, gcd_label)
-        aligned_group = Tex("$=$gcd($-21y$, $-12$)").next_to(box[2], LEFT)
+        aligned_group = Tex(f"$=$gcd(${terms[2]}$, ${terms[3]}$)").next_to(
+            box[2], LEFT
+        )
         self.play(ReplacementTransform(group, aligned_group))
         self.wait(1)
 
-        gcd_result_2 = Tex("$-3$").next_to(box[2], LEFT)
+        gcd_result_2 = Tex(f"${row_gcds[1]}$").next_to(box[2], LEFT)
         self.play(ReplacementTransform(aligned_group, gcd_result_2))
         self.wait(1)
 
-        # get gcd (28y^3, -21y)
+        # get gcd of the first column
         gcd0 = VGroup(expression[0]).copy()
         gcd2 = VGroup(expression[2]).copy()
         gcd_label = Tex("gcd")
@@ -76,15 +128,17 @@ class Main(MovingCameraScene):
         self.play(FadeIn(gcd_label.next_to(gcd2, UP)))
 
         group = VGroup(gcd0, gcd2, gcd_label)
-        aligned_group = Tex("$=$gcd($28y^3$, $-21y$)").next_to(box[0], UP)
+        aligned_group = Tex(f"$=$gcd(${terms[0]}$, ${terms[2]}$)").next_to(
+            box[0], UP
+        )
         self.play(ReplacementTransform(group, aligned_group))
         self.wait(1)
 
-        gcd_result_3 = Tex("$7y$").next_to(box[0], UP)
+        gcd_result_3 = Tex(f"${column_gcds[0]}$").next_to(box[0], UP)
         self.play(ReplacementTransform(aligned_group, gcd_result_3))
         self.wait(1)
 
-        # get gcd (16y^2, -12)
+        # get gcd of the second column
         gcd1 = VGroup(expression[1]).copy()
         gcd3 = VGroup(expression[3]).copy()
         gcd_label = Tex("gcd")
@@ -93,25 +147,29 @@ class Main(MovingCameraScene):
         self.play(FadeIn(gcd_label.next_to(gcd3, UP)))
 
         group = VGroup(gcd1, gcd3, gcd_label)
-        aligned_group = Tex("$=$gcd($16y^2$, $-12$)").next_to(box[1], UP)
+        aligned_group = Tex(f"$=$gcd(${terms[1]}$, ${terms[3]}$)").next_to(
+            box[1], UP
+        )
         self.play(
             ReplacementTransform(group, aligned_group),
             FadeOut(gcd_result_3),  # gcd result 3 blocks the aligned group
         )
         self.wait(1)
 
-        gcd_result_4 = Tex("$4$").next_to(box[1], UP)
+        gcd_result_4 = Tex(f"${column_gcds[1]}$").next_to(box[1], UP)
         self.play(
             ReplacementTransform(aligned_group, gcd_result_4), FadeIn(gcd_result_3)
         )
         self.wait(1)
 
         # make groups bordering box more cohesive
-        plus_sign = Tex("+").next_to(gcd_result_4, LEFT)
-        self.play(Create(plus_sign))
+        term1_group = VGroup(gcd_result_3, gcd_result_4)
+        if not column_gcds[1].startswith("-"):
+            plus_sign = Tex("+").next_to(gcd_result_4, LEFT)
+            self.play(Create(plus_sign))
+            term1_group.insert(1, plus_sign)
 
-        term1_group = VGroup(gcd_result_3, plus_sign, gcd_result_4)
-        term1 = Tex("$(7y+4)$").move_to(term1_group)
+        term1 = Tex(f"${factors[0]}$").move_to(term1_group)
 
         self.play(
             ReplacementTransform(term1_group, term1),
@@ -120,7 +178,7 @@ class Main(MovingCameraScene):
         )
 
         term2_group = VGroup(gcd_result_1, gcd_result_2)
-        term2 = Tex("$(4y^2-3)$").move_to(term2_group)
+        term2 = Tex(f"${factors[1]}$").move_to(term2_group)
 
         self.play(
             ReplacementTransform(term2_group, term2),
@@ -131,7 +189,7 @@ class Main(MovingCameraScene):
 
         # combine 2 terms
         terms = VGroup(term1, term2)
-        factored_term = Tex("$(7y+4)(4y^2-3)$").move_to(UP)
+        factored_term = Tex(f"${factors[0]}{factors[1]}$").move_to(UP)
 
         self.play(
             ReplacementTransform(terms, factored_term),
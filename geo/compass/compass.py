@@ -1,7 +1,30 @@
 from __future__ import annotations
 
+import hashlib
+from contextlib import contextmanager
+from typing import Callable, Iterator, Sequence
+from weakref import WeakKeyDictionary
+
 from manim import *
-from numpy import ndarray, dtype, float_, sqrt
+from manim.animation.animation import prepare_animation
+from numpy import dtype, float64, ndarray
+
+from construction import Construction, Node
+from core import CompassState, arc_intersection, normalize_angle, screen_tolerance
+from geometry import ArcGeometry, arc_components
+from spatial import SpatialIndex
+
+# arc_intersection lives in the manim-free core, re-exported for scenes
+__all__ = [
+    "ArcSweep",
+    "Compass",
+    "CompassStep",
+    "Traces",
+    "arc_intersection",
+    "screen_tolerance",
+]
+
+_scene_traces: WeakKeyDictionary = WeakKeyDictionary()
 
 
 class Compass:
@@ -10,7 +33,7 @@ class Compass:
         self,
         scene: Scene,
         center: (
-            ndarray[Any, dtype[float_]]
+            ndarray[Any, dtype[float64]]
             | tuple[float, float]
             | tuple[float, float, float]
         ) = ORIGIN,
@@ -20,9 +43,28 @@ class Compass:
         lead_width: float = 2.0,
         arm_color: ParsableManimColor = YELLOW,
         arm_width: float = 2.0,
+        redraw: bool = False,
+        construction: Construction | None = None,
+        tolerance: float = 0.5,
+        merge_traces: bool = False,
     ):
         self.scene = scene
 
+        # Finished arcs go into the scene's shared Traces, waiting in
+        # _finished until the play that drew them is over
+        self.merge_traces = merge_traces
+        self._finished: list[VGroup] = []
+
+        # How far (in pixels) drawn arcs may stray from true circles
+        self.tolerance = tolerance
+
+        # Construction graph the compass reads centers from and adds circles to
+        self.construction = construction if construction is not None else Construction()
+        self.center_node = self.construction.point(center[0], center[1])
+
+        # Arcs and points drawn in the scene, for snapping
+        self.index = SpatialIndex.for_scene(scene)
+
         # Value trackers for animation
         self._x = ValueTracker(center[0])
         self._y = ValueTracker(center[1])
@@ -34,30 +76,48 @@ class Compass:
         self.arm_color = arm_color
         self.arm_width = arm_width
 
-        self.arm = always_redraw(
-            lambda: Line(
+        # Segments of the sweep in progress, part of the compass state
+        self._segments: tuple = ()
+
+        # Steps recorded by timeline(), and the tracker values they end on
+        self._timeline: list[CompassStep] | None = None
+        self._plan: dict[str, float] = {}
+
+        if redraw:
+            self.arm = always_redraw(
+                lambda: Line(
+                    start=np.array([self.x, self.y, 0]),
+                    end=self.arm_end,
+                    color=self.arm_color,
+                    stroke_width=self.arm_width,
+                )
+            )
+
+            self.center_mark = always_redraw(
+                lambda: Dot(
+                    point=self.center,
+                    color=self.arm_color
+                )
+            )
+        else:
+            # Built once, then moved in place by the updaters below
+            self.arm = Line(
                 start=np.array([self.x, self.y, 0]),
-                end=np.array(
-                    [
-                        (self.radius * np.cos(self.angle)) + self.x,
-                        (self.radius * np.sin(self.angle)) + self.y,
-                        0,
-                    ]
-                ),
+                end=self.arm_end,
                 color=self.arm_color,
                 stroke_width=self.arm_width,
             )
-        )
+            self.center_mark = Dot(point=self.center, color=self.arm_color)
 
-        self.center_mark = always_redraw(
-            lambda: Dot(
-                point=self.center,
-                color=self.arm_color
-            )
-        )
+            self.arm.add_updater(self._update_arm)
+            self.center_mark.add_updater(self._update_center_mark)
+
+        # Named so exports can leave the compass itself out of the diagram
+        self.arm.name = "CompassArm"
+        self.center_mark.name = "CompassCenterMark"
 
         self.scene.add_foreground_mobjects(self.arm, self.center_mark)
-        self.scene.play(FadeIn(self.arm, self.center_mark))
+        self._play(FadeIn(self.arm, self.center_mark))
 
     @property
     def x(self) -> float:
@@ -84,111 +144,390 @@ class Compass:
         """The compass angle."""
         return self._angle.get_value()
 
+    @property
+    def state(self) -> CompassState:
+        """The compass's current center, radius and angle."""
+        return CompassState(self.x, self.y, self.radius, self.angle)
+
+    @property
+    def arm_end(self) -> ndarray[Any, dtype[float64]]:
+        """The point at the end of the compass arm."""
+        return self.state.arm_end
+
+    def _update_arm(self, arm: Line) -> None:
+        arm.set_points_by_ends(np.array([self.x, self.y, 0]), self.arm_end)
+
+    def _update_center_mark(self, center_mark: Dot) -> None:
+        center_mark.move_to(self.center)
+
+    def _merge_finished(self) -> None:
+        """Moves arcs drawn by the last play into the scene's traces."""
+        if not self._finished:
+            return
+
+        traces = Traces.for_scene(self.scene)
+        for arcs in self._finished:
+            self.scene.remove(arcs)
+            for arc in arcs:
+                traces.absorb(arc)
+        self._finished = []
+
+    def content_hash(self) -> str:
+        """A digest of everything that determines what the compass draws.
+
+        Built from the tracker values, the style and the segments being
+        swept, so it is the same across runs for the same compass state.
+        """
+        state = (
+            self.x,
+            self.y,
+            self.radius,
+            self.angle,
+            str(self.lead_color),
+            self.lead_width,
+            str(self.arm_color),
+            self.arm_width,
+            [(start, end, *map(str, color)) for start, end, *color in self._segments],
+        )
+        return hashlib.sha256(repr(state).encode()).hexdigest()
+
+    def _planned(self, name: str) -> float:
+        """A tracker's value once every recorded timeline step has played."""
+        if self._timeline is not None and name in self._plan:
+            return self._plan[name]
+        return getattr(self, name)
+
+    def _planned_state(self) -> CompassState:
+        """The compass state once every recorded timeline step has played."""
+        return CompassState(*map(self._planned, CompassState._fields))
+
+    def _play(
+        self,
+        *animations: Animation | Any,
+        on_begin: Callable[[], None] | None = None,
+        on_finish: Callable[[], None] | None = None,
+    ) -> None:
+        """Plays compass animations, tagged with the compass state.
+
+        The compass mobjects are driven by updaters whose inputs (the
+        trackers and swept segments) don't show up in manim's hash of a play
+        call, so the state is attached to each animation where it does.
+
+        ``on_begin`` and ``on_finish`` run right before and after the
+        animations, or when their step starts and ends inside a timeline.
+        """
+        state = self.content_hash()
+
+        animations = [prepare_animation(animation) for animation in animations]
+        for animation in animations:
+            animation.compass_state = state
+
+        if self._timeline is not None:
+            self._timeline.append(
+                CompassStep(*animations, on_begin=on_begin, on_finish=on_finish)
+            )
+            return
+
+        if on_begin is not None:
+            on_begin()
+        self.scene.play(*animations)
+        if on_finish is not None:
+            on_finish()
+        self._merge_finished()
+
+    @contextmanager
+    def timeline(self, lag_ratio: float = 1.0, **kwargs) -> Iterator[Compass]:
+        """Records compass operations and plays them as a single animation.
+
+        Inside the ``with`` block, operations are queued instead of played.
+        On exit they play back to back in one ``Succession``, or with a
+        ``lag_ratio`` below 1, overlapping in an ``AnimationGroup`` (meant for
+        operations on different trackers, like moving while resizing).
+        """
+        self._timeline = []
+        self._plan = {}
+        try:
+            yield self
+            steps = self._timeline
+        finally:
+            self._timeline = None
+            self._plan = {}
+
+        if not steps:
+            return
+
+        if lag_ratio >= 1:
+            self.scene.play(Succession(*steps, **kwargs))
+        else:
+            self.scene.play(AnimationGroup(*steps, lag_ratio=lag_ratio, **kwargs))
+        self._merge_finished()
+
     def move_to(
         self,
         center: (
-            ndarray[Any, dtype[float_]]
+            ndarray[Any, dtype[float64]]
             | tuple[float, float]
             | tuple[float, float, float]
+            | Node
         ),
+        snap: float | None = None,
         **kwargs,
     ) -> Compass:
-        """Animates moving the center of the compass."""
-        self.scene.play(
+        """Animates moving the center of the compass.
+
+        With ``snap``, the compass moves onto the nearest existing point within
+        that distance instead, if there is one.
+        """
+        if snap is not None and not isinstance(center, Node):
+            nearest = self.index.nearest_point(center, snap)
+            if nearest is not None:
+                point, item = nearest
+                center = item if isinstance(item, Node) else point
+
+        if isinstance(center, Node):
+            self.center_node = center
+            center = center.value
+        else:
+            self.center_node = self.construction.point(center[0], center[1])
+
+        self._play(
             AnimationGroup(
                 self._x.animate(kwargs=kwargs).set_value(center[0]),  # linear smoothens its movement
                 self._y.animate(kwargs=kwargs).set_value(center[1]),
             )
         )
+        self._plan.update(x=center[0], y=center[1])
         return self
 
     def set_radius(self, length: float, **kwargs) -> Compass:
         """Animates extending or retracting of the compass."""
-        self.scene.play(self._radius.animate(kwargs=kwargs).set_value(length))
+        self._play(self._radius.animate(kwargs=kwargs).set_value(length))
+        self._plan.update(radius=length)
         return self
 
     def set_angle(self, angle: float, **kwargs) -> Compass:
         """Animates rotation of the compass."""
-        self.scene.play(self._angle.animate(kwargs=kwargs).set_value(angle))
-        self._angle.set_value(angle % (360 * DEGREES))
+        self._play(
+            self._angle.animate(kwargs=kwargs).set_value(angle),
+            on_finish=lambda: self._angle.set_value(normalize_angle(angle)),
+        )
+        self._plan.update(angle=normalize_angle(angle))
         return self
 
     def draw_segments(
         self, *segments: tuple[float, float] | tuple[float, float, float]
-    ) -> Mobject:
-        """Draws multiple arcs in one sweep."""
-
-        arcs = always_redraw(
-            lambda: VGroup(
-                *[
+    ) -> Mobject | tuple[ArcGeometry, ...]:
+        """Draws multiple arcs in one sweep.
+
+        With ``merge_traces``, the arcs are merged into the scene's
+        ``Traces`` once drawn, and what's returned is their geometry.
+        """
+
+        state = self._planned_state()
+        x, y, radius = state.x, state.y, state.radius
+        angle = state.sweep_end()
+        # Scenes without a camera, like DryRun, tessellate for the configured one
+        camera = getattr(self.scene, "camera", config)
+        tolerance = screen_tolerance(camera, self.tolerance)
+
+        sweep = ArcSweep(
+            self._angle,
+            [
+                (
+                    start,
+                    end,
                     Arc(
-                        radius=self.radius,
-                        arc_center=np.array([self.x, self.y, 0.0]),
+                        radius=radius,
+                        arc_center=np.array([x, y, 0.0]),
                         start_angle=start,
                         color=segment_color or self.lead_color,
                         stroke_width=self.lead_width,
-                        angle=(
-                            min(self.angle - start, end - start)
-                            if self.angle > start
-                            else 0
-                        ),
-                    )
-                    for start, end, *segment_color in segments
-                ]
-            )
+                        angle=end - start,
+                        num_components=arc_components(radius, end - start, tolerance),
+                    ),
+                )
+                for start, end, *segment_color in segments
+            ],
         )
+        arcs = sweep.arcs
+
+        circle = self.construction.circle(self.center_node, radius)
+        for arc in arcs:
+            arc.construction_node = circle
+
+        def begin() -> None:
+            sweep.update()
+            arcs.add_updater(sweep.update)
+            self.scene.add(arcs)
+
+        def finish() -> None:
+            sweep.update()
+            arcs.clear_updaters()
+            self._angle.set_value(normalize_angle(angle))
+
+            for arc in arcs:
+                self.index.add_arc(arc)
+            if self.merge_traces:
+                self._finished.append(arcs)
 
         # Animate
-        self.scene.add(arcs)
-        self.set_angle(2 * PI + self.angle)
+        self._segments = segments
+        self._play(self._angle.animate.set_value(angle), on_begin=begin, on_finish=finish)
+        self._segments = ()
+
+        self._plan.update(angle=normalize_angle(angle))
 
-        # Remove arc updaters
-        arcs.clear_updaters()
+        if self.merge_traces:
+            return state.arcs(segments, circle)
         return arcs
 
-    def dot_at(self, alpha: float) -> Dot:
-        return Dot(Circle(
-            radius=self.radius, arc_center=np.array([self.x, self.y, 0.0])
-        ).point_from_proportion(alpha))
+    def points_at(self, alphas: Sequence[float] | ndarray) -> ndarray:
+        """Points a proportion ``alphas`` of the way around the compass's circle,
+        as an ``(N, 3)`` array. Each point can be snapped to."""
 
+        points = self._planned_state().points_at(alphas)
+        for point in points:
+            self.index.add_point(point)
+        return points
 
-def arc_intersection(scene: Scene, a: Arc, b: Arc) -> tuple[tuple[float, float], tuple[float, float]] | None:
-    """Gets the intersection points of two arcs."""
+    def dot_at(self, alpha: float) -> Dot:
+        dot = Dot(self._planned_state().points_at(alpha)[0])
+
+        self.index.add_point(dot.get_center(), dot)
+        return dot
+
+    def dots_at(self, alphas: Sequence[float] | ndarray, **kwargs) -> PMobject:
+        """Marks many points around the compass's circle as one point cloud,
+        for tick marks and polygon vertices."""
+        kwargs.setdefault("stroke_width", 8)
+        return PMobject(**kwargs).add_points(self.points_at(alphas))
+
+
+class Traces(VGroup):
+    """Finished compass arcs, merged into one path per stroke style.
+
+    Each absorbed arc becomes another subpath of the path for its color,
+    width and opacity, so hundreds of arcs draw like a handful of paths.
+    """
+
+    @classmethod
+    def for_scene(cls, scene: Scene) -> Traces:
+        """The traces shared by every compass in a scene, added to it if needed."""
+        if scene not in _scene_traces:
+            _scene_traces[scene] = cls()
+        traces = _scene_traces[scene]
+        if traces not in scene.mobjects:
+            scene.add(traces)
+        return traces
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.paths: dict[tuple, VMobject] = {}
+
+    def absorb(self, arc: VMobject) -> VMobject:
+        """Appends an arc to the path for its style, returning that path."""
+        style = (
+            arc.get_stroke_color().to_hex(),
+            arc.get_stroke_width(),
+            arc.get_stroke_opacity(),
+        )
+        if style not in self.paths:
+            self.paths[style] = VMobject(
+                stroke_color=style[0], stroke_width=style[1], stroke_opacity=style[2]
+            )
+            self.add(self.paths[style])
 
-    x0 = a.get_arc_center()[0]
-    y0 = a.get_arc_center()[1]
-    r0 = a.radius
+        self.paths[style].append_points(arc.points)
+        return self.paths[style]
 
-    x1 = b.get_arc_center()[0]
-    y1 = b.get_arc_center()[1]
-    r1 = b.radius
 
-    # https://stackoverflow.com/questions/55816902/finding-the-intersection-of-two-circles
-    d = sqrt((x1 - x0) ** 2 + (y1 - y0) ** 2)
+class CompassStep(AnimationGroup):
+    """One compass operation inside a timeline.
 
-    # Non-intersecting
-    if d > r0 + r1:
-        return None
+    Runs the operation's setup and cleanup when the step itself starts and
+    ends, rather than when the whole timeline does.
+    """
 
-    # One circle within other
-    if d < abs(r0 - r1):
-        return None
+    def __init__(
+        self,
+        *animations: Animation,
+        on_begin: Callable[[], None] | None = None,
+        on_finish: Callable[[], None] | None = None,
+        **kwargs,
+    ):
+        super().__init__(*animations, **kwargs)
+        self.on_begin = on_begin
+        self.on_finish = on_finish
+
+    def begin(self) -> None:
+        if self.on_begin is not None:
+            self.on_begin()
+        super().begin()
 
-    # Coincident circles
-    if d == 0 and r0 == r1:
-        return None
+    def finish(self) -> None:
+        super().finish()
+        if self.on_finish is not None:
+            self.on_finish()
 
-    else:
-        a = ((r0 ** 2) - (r1 ** 2) + (d ** 2)) / (2 * d)
-        h = sqrt((r0 ** 2) - (a ** 2))
 
-        x2 = x0 + (a * (x1 - x0) / d)
-        y2 = y0 + (a * (y1 - y0) / d)
+class ArcSweep:
+    """Reveals precomputed arcs as an angle tracker sweeps past them.
 
-        x3 = x2 + (h * (y1 - y0) / d)
-        y3 = y2 - (h * (x1 - x0) / d)
+    Each arc's full curve is built once. Every frame, only the arcs the
+    angle is currently inside of are sliced again from their full curve;
+    arcs not yet reached or already finished are left untouched.
+    """
 
-        x4 = x2 - (h * (y1 - y0) / d)
-        y4 = y2 + (h * (x1 - x0) / d)
+    def __init__(
+        self, angle: ValueTracker, segments: list[tuple[float, float, Arc]]
+    ):
+        self.angle = angle
+        self.extents = [(start, end) for start, end, _ in segments]
+        self.curves = [arc for *_, arc in segments]
+        self.arcs = VGroup(*[arc.copy() for arc in self.curves])
+
+        # Segment indices sorted by start angle
+        self.order = sorted(range(len(segments)), key=lambda i: self.extents[i][0])
+
+        self.reset()
+
+    def reset(self) -> None:
+        """Hides every arc, ready for a sweep from the start."""
+        self._next = 0  # position in self.order of the next segment to start
+        self._growing = []
+        self._last_angle = -np.inf
+
+        for arc, curve in zip(self.arcs, self.curves):
+            arc.pointwise_become_partial(curve, 0, 0)
+
+    def update(self, mobject: Mobject | None = None) -> None:
+        """Grows the arcs up to the current angle."""
+        angle = self.angle.get_value()
+
+        # Sweeping backwards, start over
+        if angle < self._last_angle:
+            self.reset()
+        self._last_angle = angle
+
+        # Start segments the angle has passed
+        while (
+            self._next < len(self.order)
+            and angle > self.extents[self.order[self._next]][0]
+        ):
+            self._growing.append(self.order[self._next])
+            self._next += 1
+
+        growing = []
+        for i in self._growing:
+            start, end = self.extents[i]
+
+            if angle >= end:
+                self.arcs[i].pointwise_become_partial(self.curves[i], 0, 1)
+            else:
+                self.arcs[i].pointwise_become_partial(
+                    self.curves[i], 0, (angle - start) / (end - start)
+                )
+                growing.append(i)
+
+        self._growing = growing
 
-        return (x3, y3), (x4, y4)
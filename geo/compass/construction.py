@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+from numpy import ndarray
+
+from geometry import intersect_circles, intersect_line_circle, intersect_lines
+
+
+class Node:
+    """A value in a construction, computed lazily from its parents.
+
+    Values are memoized until one of the node's ancestors changes.
+    """
+
+    def __init__(self, *parents: Node):
+        self.parents = parents
+        self.children: list[Node] = []
+        for parent in parents:
+            parent.children.append(self)
+
+        self._value = None
+        self._dirty = True
+        self.evaluations = 0  # times the value has been computed
+
+    @property
+    def value(self) -> Any:
+        """The node's value, computed only if an ancestor has changed."""
+        if self._dirty:
+            self._value = self.compute(*(parent.value for parent in self.parents))
+            self._dirty = False
+            self.evaluations += 1
+        return self._value
+
+    def compute(self, *values: Any) -> Any:
+        raise NotImplementedError
+
+    def invalidate(self) -> None:
+        """Marks every node downstream of this one for recomputation."""
+
+        # A dirty node's descendants are already dirty, so stop there
+        stack = list(self.children)
+        while stack:
+            node = stack.pop()
+            if not node._dirty:
+                node._dirty = True
+                stack.extend(node.children)
+
+
+class PointNode(Node):
+    """A free point, which can be moved."""
+
+    def __init__(self, x: float, y: float):
+        super().__init__()
+        self._value = np.array([x, y], dtype=float)
+        self._dirty = False
+
+    def move_to(self, x: float, y: float) -> PointNode:
+        """Moves the point, invalidating everything built from it."""
+        self._value = np.array([x, y], dtype=float)
+        self.invalidate()
+        return self
+
+
+class ConstantNode(Node):
+    """A fixed value, such as a compass radius."""
+
+    def __init__(self, value: Any):
+        super().__init__()
+        self._value = value
+        self._dirty = False
+
+    def set_value(self, value: Any) -> ConstantNode:
+        self._value = value
+        self.invalidate()
+        return self
+
+
+class DistanceNode(Node):
+    """The distance between two points."""
+
+    def compute(self, a: ndarray, b: ndarray) -> float:
+        return float(np.hypot(*(b - a)))
+
+
+class CircleNode(Node):
+    """A circle from a center point and a radius, as ``(center, radius)``."""
+
+    def compute(self, center: ndarray, radius: float) -> tuple[ndarray, float]:
+        return center, radius
+
+
+class LineNode(Node):
+    """The line through two points, as ``(start, end)``."""
+
+    def compute(self, start: ndarray, end: ndarray) -> tuple[ndarray, ndarray]:
+        return start, end
+
+
+class IntersectionNode(Node):
+    """One intersection point of two circles, two lines, or a line and a circle.
+
+    Its value is ``None`` while the two don't intersect (or, for the second
+    point, while they only touch).
+    """
+
+    def __init__(self, a: CircleNode | LineNode, b: CircleNode | LineNode, index: int = 0):
+        super().__init__(a, b)
+        self.index = index
+
+    def compute(self, a: tuple, b: tuple) -> ndarray | None:
+        a_line, b_line = (isinstance(parent, LineNode) for parent in self.parents)
+        if a_line and b_line:
+            return intersect_lines(*a, *b)
+
+        if a_line or b_line:
+            line, circle = (a, b) if a_line else (b, a)
+            points = intersect_line_circle(*line, *circle)
+        else:
+            points = intersect_circles(*a, *b)
+        return points[self.index] if self.index < len(points) else None
+
+
+class Construction:
+    """A graph of points, lines, circles and their intersections.
+
+    Derived values are computed on demand and cached. Moving a free point
+    only recomputes the nodes built from it.
+    """
+
+    def __init__(self):
+        self.nodes: list[Node] = []
+        self._intersections: dict[tuple[int, int], tuple[IntersectionNode, ...]] = {}
+
+    def _add(self, node: Node) -> Node:
+        node.construction = self
+        node.key = len(self.nodes)  # stable across runs, unlike id()
+        self.nodes.append(node)
+        return node
+
+    def _as_node(self, value: Node | Any) -> Node:
+        return value if isinstance(value, Node) else self._add(ConstantNode(value))
+
+    def point(self, x: float, y: float) -> PointNode:
+        return self._add(PointNode(x, y))
+
+    def distance(self, a: PointNode, b: PointNode) -> DistanceNode:
+        return self._add(DistanceNode(a, b))
+
+    def circle(self, center: Node, radius: Node | float) -> CircleNode:
+        return self._add(CircleNode(center, self._as_node(radius)))
+
+    def line(self, start: Node, end: Node) -> LineNode:
+        return self._add(LineNode(start, end))
+
+    def intersections(
+        self, a: CircleNode | LineNode, b: CircleNode | LineNode
+    ) -> tuple[IntersectionNode, ...]:
+        """The intersection points of two circles or a line and a circle (two),
+        or of two lines (one).
+
+        Asking again for the same pair returns the same nodes. Both have to
+        belong to this construction.
+        """
+
+        if a.construction is not self or b.construction is not self:
+            raise ValueError("Can only intersect nodes of this construction")
+
+        key = (a.key, b.key)
+        if key not in self._intersections:
+            count = 1 if isinstance(a, LineNode) and isinstance(b, LineNode) else 2
+            self._intersections[key] = tuple(
+                self._add(IntersectionNode(a, b, index)) for index in range(count)
+            )
+        return self._intersections[key]
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from typing import Any, NamedTuple, Sequence
+
+import numpy as np
+from numpy import ndarray
+
+from construction import CircleNode, Node
+from geometry import ArcGeometry, circle_points, in_arc_extent, intersect_circles
+from spatial import SpatialIndex
+
+# Everything here is plain NumPy, so it imports in milliseconds; manim only
+# comes in with the Compass mobjects in compass.py
+
+TAU = 2 * np.pi
+
+
+def normalize_angle(angle: float) -> float:
+    """An angle wrapped into ``[0, TAU)``."""
+    return angle % TAU
+
+
+def screen_tolerance(camera: Any, pixels: float) -> float:
+    """A distance of ``pixels`` on screen, in scene units at the camera's zoom.
+
+    ``camera`` is anything with a ``frame_width`` and ``pixel_width``, like a
+    manim camera or manim's ``config``.
+    """
+    return pixels * camera.frame_width / camera.pixel_width
+
+
+class CompassState(NamedTuple):
+    """Where a compass is: its center, radius and arm angle."""
+
+    x: float
+    y: float
+    radius: float
+    angle: float
+
+    @property
+    def center(self) -> tuple[float, float, float]:
+        return self.x, self.y, 0
+
+    @property
+    def arm_end(self) -> ndarray:
+        """The point at the end of the compass arm."""
+        return np.array(
+            [
+                self.x + self.radius * np.cos(self.angle),
+                self.y + self.radius * np.sin(self.angle),
+                0,
+            ]
+        )
+
+    def sweep_end(self) -> float:
+        """The angle a full sweep from here ends on, before wrapping."""
+        return TAU + self.angle
+
+    def points_at(self, alphas: Sequence[float] | ndarray) -> ndarray:
+        """Points a proportion ``alphas`` of the way around the circle, as an
+        ``(N, 3)`` array."""
+        return circle_points((self.x, self.y), self.radius, alphas)
+
+    def arcs(
+        self, segments: Sequence[tuple[float, ...]], node: Node | None = None
+    ) -> tuple[ArcGeometry, ...]:
+        """The arcs ``(start, end, ...)`` segments of the circle make."""
+        return tuple(
+            ArcGeometry((self.x, self.y), self.radius, start, end - start, node)
+            for start, end, *_ in segments
+        )
+
+
+def arc_intersection(
+    scene: Any, a: Any, b: Any, within_arcs: bool = True
+) -> tuple[tuple[float, float], ...] | None:
+    """Gets the points where two arcs cross.
+
+    ``a`` and ``b`` can be manim ``Arc``s or ``ArcGeometry``s. Only points on
+    both arcs count, unless ``within_arcs`` is off, in which case the arcs are
+    treated as full circles. Tangent arcs meet at one point. Returns ``None``
+    if the arcs don't meet.
+
+    The points are indexed for snapping in ``scene``'s ``SpatialIndex``,
+    unless ``scene`` is ``None``.
+    """
+
+    circle_a: CircleNode | None = getattr(a, "construction_node", None)
+    circle_b: CircleNode | None = getattr(b, "construction_node", None)
+
+    # Compass arcs are read from (and recorded in) their construction, if
+    # they share one; compasses made without one each have their own
+    if (
+        circle_a is not None
+        and circle_b is not None
+        and circle_a.construction is circle_b.construction
+    ):
+        nodes = circle_a.construction.intersections(circle_a, circle_b)
+        found = [(node.value, node) for node in nodes if node.value is not None]
+    else:
+        points = intersect_circles(a.get_arc_center(), a.radius, b.get_arc_center(), b.radius)
+        found = [(point, None) for point in points]
+
+    if within_arcs:
+        found = [
+            (point, node)
+            for point, node in found
+            if all(
+                in_arc_extent(point, arc.get_arc_center(), arc.start_angle, arc.angle)
+                for arc in (a, b)
+            )
+        ]
+    if not found:
+        return None
+
+    if scene is not None:
+        index = SpatialIndex.for_scene(scene)
+        for point, node in found:
+            index.add_point(point, node)
+
+    return tuple((float(x), float(y)) for (x, y), _ in found)
+
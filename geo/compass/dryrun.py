@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from manim import Animation, Arc, Dot, Mobject
+from manim.animation.animation import prepare_animation
+from manim.utils.family import extract_mobject_family_members
+
+
+class DryRun:
+    """Stands in for a Scene so constructions run without rendering anything.
+
+    Every animation jumps straight to its end state, so a ``Compass`` on a
+    ``DryRun`` updates its trackers, construction graph and spatial index
+    exactly as it would in a scene, without frames or movie files::
+
+        run = DryRun()
+        compass = Compass(run, radius=2.5)
+        compass.move_to(LEFT * 2)
+        arcs = compass.draw_segments((0.05 * TAU, 0.15 * TAU))
+    """
+
+    def __init__(self):
+        self.mobjects: list[Mobject] = []
+        self.foreground_mobjects: list[Mobject] = []
+        self.plays = 0
+
+    def add(self, *mobjects: Mobject) -> DryRun:
+        for mobject in mobjects:
+            if mobject not in self.mobjects:
+                self.mobjects.append(mobject)
+        return self
+
+    def remove(self, *mobjects: Mobject) -> DryRun:
+        for mobject in mobjects:
+            if mobject in self.mobjects:
+                self.mobjects.remove(mobject)
+            if mobject in self.foreground_mobjects:
+                self.foreground_mobjects.remove(mobject)
+        return self
+
+    def get_mobject_family_members(self) -> list[Mobject]:
+        """Every mobject in the scene and their submobjects, as ``Scene`` has.
+
+        Introducer animations like ``FadeIn`` look here to decide whether to
+        add their mobject.
+        """
+        return extract_mobject_family_members(self.mobjects)
+
+    def add_foreground_mobjects(self, *mobjects: Mobject) -> DryRun:
+        self.foreground_mobjects.extend(mobjects)
+        return self.add(*mobjects)
+
+    def play(self, *animations: Animation, **kwargs) -> None:
+        """Applies the animations' end states immediately."""
+
+        for animation in map(prepare_animation, animations):
+            animation._setup_scene(self)
+            animation.begin()
+            animation.finish()
+            animation.clean_up_from_scene(self)
+
+        for mobject in self.mobjects:
+            mobject.update(0)
+        self.plays += 1
+
+    def wait(self, *args, **kwargs) -> None:
+        pass
+
+    @property
+    def arcs(self) -> list[Arc]:
+        """Every arc drawn so far (not counting dots)."""
+        return [
+            member
+            for mobject in self.mobjects
+            for member in mobject.get_family()
+            if isinstance(member, Arc) and not isinstance(member, Dot)
+        ]
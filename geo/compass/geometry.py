@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+from typing import Any, NamedTuple, Sequence
+
+import numpy as np
+from numpy import ndarray
+
+
+class CircleIntersections(NamedTuple):
+    """Intersections of every circle in one set with every circle in another.
+
+    For ``N`` circles against ``M`` circles, ``points`` has shape
+    ``(N, M, 2, 2)`` (two ``(x, y)`` points per pair) and ``valid`` has shape
+    ``(N, M, 2)``. The case masks have shape ``(N, M)``. Points of pairs that
+    don't intersect are NaN.
+    """
+
+    points: ndarray
+    valid: ndarray
+    tangent: ndarray
+    disjoint: ndarray
+    contained: ndarray
+    coincident: ndarray
+
+
+class ArcGeometry(NamedTuple):
+    """An arc as plain numbers, readable in place of a manim ``Arc``."""
+
+    center: tuple[float, float]
+    radius: float
+    start_angle: float
+    angle: float
+    construction_node: Any = None
+
+    def get_arc_center(self) -> ndarray:
+        return np.array([self.center[0], self.center[1], 0.0])
+
+
+# Distances (and angles, in radians) closer than this count as equal
+EPSILON = 1e-9
+
+
+def circle_intersections(
+    centers_a: Any, radii_a: Any, centers_b: Any, radii_b: Any, eps: float = EPSILON
+) -> CircleIntersections:
+    """Intersects ``N`` circles with ``M`` circles in one pass.
+
+    Circles within ``eps`` of touching are tangent and meet at a single
+    point (the first of the pair; the second is marked invalid).
+    """
+
+    # Only x and y matter, so 3D manim points work too
+    c0 = np.atleast_2d(np.asarray(centers_a, dtype=float))[:, None, :2]
+    c1 = np.atleast_2d(np.asarray(centers_b, dtype=float))[None, :, :2]
+    r0 = np.atleast_1d(np.asarray(radii_a, dtype=float))[:, None]
+    r1 = np.atleast_1d(np.asarray(radii_b, dtype=float))[None, :]
+
+    # https://stackoverflow.com/questions/55816902/finding-the-intersection-of-two-circles
+    delta = c1 - c0
+    d = np.hypot(delta[..., 0], delta[..., 1])
+
+    coincident = (d <= eps) & (np.abs(r0 - r1) <= eps)
+    disjoint = d > r0 + r1 + eps
+    contained = (d < np.abs(r0 - r1) - eps) & ~coincident
+    intersecting = ~(disjoint | contained | coincident)
+    tangent = intersecting & (
+        (np.abs(d - (r0 + r1)) <= eps) | (np.abs(d - np.abs(r0 - r1)) <= eps)
+    )
+
+    # Intersecting circles are at least eps apart, so d is safe to divide by
+    safe_d = np.where(intersecting, d, 1.0)
+    a = (r0 ** 2 - r1 ** 2 + d ** 2) / (2 * safe_d)
+    h = np.where(tangent, 0.0, np.sqrt(np.maximum(r0 ** 2 - a ** 2, 0)))
+
+    unit = delta / safe_d[..., None]
+    mid = c0 + a[..., None] * unit
+    offset = h[..., None] * np.stack([unit[..., 1], -unit[..., 0]], axis=-1)
+
+    points = np.stack([mid + offset, mid - offset], axis=-2)
+    points[~intersecting] = np.nan
+
+    valid = np.stack([intersecting, intersecting & ~tangent], axis=-1)
+    return CircleIntersections(points, valid, tangent, disjoint, contained, coincident)
+
+
+def in_arc_extent(
+    points: Any, centers: Any, start_angles: Any, angles: Any, eps: float = EPSILON
+) -> ndarray:
+    """Whether each point lies within its arc's angular extent (give or take ``eps``).
+
+    Arrays broadcast against each other; ``points`` and ``centers`` have a
+    trailing axis of at least 2 (x, y).
+    """
+
+    points = np.asarray(points, dtype=float)
+    centers = np.asarray(centers, dtype=float)
+    start_angles = np.asarray(start_angles, dtype=float)
+    angles = np.asarray(angles, dtype=float)
+
+    theta = np.arctan2(
+        points[..., 1] - centers[..., 1], points[..., 0] - centers[..., 0]
+    )
+
+    # Angle swept from the arc's start to the point, in the arc's direction
+    swept = np.where(
+        angles >= 0,
+        np.mod(theta - start_angles, 2 * np.pi),
+        np.mod(start_angles - theta, 2 * np.pi),
+    )
+    return (
+        (np.abs(angles) >= 2 * np.pi - eps)
+        | (swept <= np.abs(angles) + eps)
+        | (swept >= 2 * np.pi - eps)  # just before the start
+    )
+
+
+def arc_intersections(
+    arcs_a: Sequence[Any],
+    arcs_b: Sequence[Any],
+    within_arcs: bool = False,
+    eps: float = EPSILON,
+) -> CircleIntersections:
+    """Intersects every arc in ``arcs_a`` with every arc in ``arcs_b``.
+
+    With ``within_arcs``, points outside either arc's angular extent are
+    marked invalid.
+    """
+
+    centers_a = np.array([arc.get_arc_center() for arc in arcs_a], dtype=float)
+    centers_b = np.array([arc.get_arc_center() for arc in arcs_b], dtype=float)
+
+    result = circle_intersections(
+        centers_a,
+        [arc.radius for arc in arcs_a],
+        centers_b,
+        [arc.radius for arc in arcs_b],
+        eps,
+    )
+    if not within_arcs:
+        return result
+
+    starts_a = np.array([arc.start_angle for arc in arcs_a], dtype=float)
+    starts_b = np.array([arc.start_angle for arc in arcs_b], dtype=float)
+    angles_a = np.array([arc.angle for arc in arcs_a], dtype=float)
+    angles_b = np.array([arc.angle for arc in arcs_b], dtype=float)
+
+    with np.errstate(invalid="ignore"):
+        valid = (
+            result.valid
+            & in_arc_extent(
+                result.points,
+                centers_a[:, None, None, :],
+                starts_a[:, None, None],
+                angles_a[:, None, None],
+                eps,
+            )
+            & in_arc_extent(
+                result.points,
+                centers_b[None, :, None, :],
+                starts_b[None, :, None],
+                angles_b[None, :, None],
+                eps,
+            )
+        )
+    return result._replace(valid=valid)
+
+
+def intersect_circles(
+    center_a: Any, radius_a: float, center_b: Any, radius_b: float, eps: float = EPSILON
+) -> list[ndarray]:
+    """The zero, one (tangent) or two ``(x, y)`` points where two circles meet.
+
+    Coincident circles have no distinct intersection points.
+    """
+    result = circle_intersections(center_a, radius_a, center_b, radius_b, eps)
+    points, valid = result.points[0, 0], result.valid[0, 0]
+    return [point for point, ok in zip(points, valid) if ok]
+
+
+def intersect_line_circle(
+    p0: Any, p1: Any, center: Any, radius: float, eps: float = EPSILON
+) -> list[ndarray]:
+    """The zero, one (tangent) or two ``(x, y)`` points where the line through
+    ``p0, p1`` meets a circle, in order along the line."""
+
+    p0, p1, center = (np.asarray(p, dtype=float)[:2] for p in (p0, p1, center))
+    u = p1 - p0
+    length = np.hypot(*u)
+    if length <= eps:
+        return []
+    u = u / length
+
+    # Foot of the perpendicular from the center, and its distance from it
+    t = np.dot(center - p0, u)
+    foot = p0 + t * u
+    distance = np.hypot(*(center - foot))
+
+    if distance > radius + eps:
+        return []
+    if abs(distance - radius) <= eps:
+        return [foot]
+
+    half_chord = np.sqrt(radius ** 2 - distance ** 2)
+    return [foot - half_chord * u, foot + half_chord * u]
+
+
+def intersect_lines(
+    p0: Any, p1: Any, q0: Any, q1: Any, eps: float = EPSILON
+) -> ndarray | None:
+    """Intersects the line through ``p0, p1`` with the line through ``q0, q1``.
+
+    Returns ``None`` for lines within ``eps`` (radians) of parallel. The point
+    has as many coordinates as ``p0``, so manim's 3D points come back 3D.
+    """
+
+    dimensions = len(p0)
+    p0, p1, q0, q1 = (np.asarray(p, dtype=float) for p in (p0, p1, q0, q1))
+    u = p1[:2] - p0[:2]
+    v = q1[:2] - q0[:2]
+
+    # The cross product is |u||v| sin(angle between them)
+    cross = u[0] * v[1] - u[1] * v[0]
+    if abs(cross) <= eps * np.hypot(*u) * np.hypot(*v):
+        return None
+
+    w = q0[:2] - p0[:2]
+    t = (w[0] * v[1] - w[1] * v[0]) / cross
+
+    point = p0.copy()
+    point[:2] = p0[:2] + t * u
+    return point[:dimensions]
+
+
+def circle_points(center: Any, radius: float, alphas: Any) -> ndarray:
+    """The points a proportion ``alphas`` of the way around a circle, as an
+    ``(N, 3)`` array.
+
+    Like manim's ``Circle.point_from_proportion``, proportions run
+    counterclockwise from the circle's rightmost point.
+    """
+
+    cx, cy = np.asarray(center, dtype=float)[:2]
+    thetas = 2 * np.pi * np.atleast_1d(np.asarray(alphas, dtype=float))
+    return np.stack(
+        [cx + radius * np.cos(thetas), cy + radius * np.sin(thetas), np.zeros_like(thetas)],
+        axis=-1,
+    )
+
+
+# A cubic Bezier through a quarter circle's ends, with manim's handles, strays
+# from the circle by about this much per unit of radius. The error grows with
+# the sixth power of the angle a curve spans.
+QUARTER_ARC_ERROR = 2.7e-4
+
+
+def arc_components(radius: float, angle: float, tolerance: float) -> int:
+    """How many anchors (manim's ``num_components``) an arc needs to stay within
+    ``tolerance`` of the true arc.
+
+    No curve spans more than a quarter turn, however loose the tolerance.
+    """
+
+    if radius <= 0 or tolerance <= 0:
+        return 9  # manim's default
+
+    error = QUARTER_ARC_ERROR * radius
+    max_angle = (np.pi / 2) * min(1.0, (tolerance / error) ** (1 / 6))
+    return max(1, int(np.ceil(abs(angle) / max_angle))) + 1
+
+
+def arc_bounds(
+    center: Any, radius: float, start_angle: float, angle: float
+) -> tuple[float, float, float, float]:
+    """The ``(x_min, y_min, x_max, y_max)`` bounding box of an arc."""
+
+    cx, cy = np.asarray(center, dtype=float)[:2]
+
+    # The box is set by the arc's endpoints and any axis crossings it sweeps over
+    thetas = np.array([start_angle, start_angle + angle, 0, np.pi / 2, np.pi, 3 * np.pi / 2])
+    points = np.stack([cx + radius * np.cos(thetas), cy + radius * np.sin(thetas)], axis=-1)
+    points = points[
+        np.r_[True, True, in_arc_extent(points[2:], (cx, cy), start_angle, angle)]
+    ]
+
+    x_min, y_min = points.min(axis=0)
+    x_max, y_max = points.max(axis=0)
+    return float(x_min), float(y_min), float(x_max), float(y_max)
@@ -1,36 +1,47 @@
 from manim import *
 from compass import Compass, arc_intersection
+from construction import Construction
 
 
 class Main(Scene):
     def construct(self):
 
+        # Segment endpoints, which the rest of the construction is built from
+        construction = Construction()
+        start = construction.point(-2, 0)
+        end = construction.point(2, 0)
+
         # Create line
-        line = Line(LEFT * 2, RIGHT * 2)
+        line = Line([*start.value, 0], [*end.value, 0])
         self.play(Create(line))
         self.wait()
 
         # Create compass
-        compass = Compass(self, arm_width=4, radius=2.5)
+        compass = Compass(
+            self, arm_width=4, radius=2.5, construction=construction, merge_traces=True
+        )
         self.wait()
 
         # Move compass to create arcs
-        compass.move_to(LEFT * 2)
-        arc1 = compass.draw_segments((0.85 * TAU, 0.95 * TAU), (0.05 * TAU, 0.15 * TAU))
+        self.next_section("Arcs")
+        with compass.timeline():
+            compass.move_to(start)
+            arc1 = compass.draw_segments((0.85 * TAU, 0.95 * TAU), (0.05 * TAU, 0.15 * TAU))
         self.wait()
 
-        compass.move_to(RIGHT * 2)
-        arc2 = compass.draw_segments((0.35 * TAU, 0.45 * TAU), (0.55 * TAU, 0.65 * TAU))
+        with compass.timeline():
+            compass.move_to(end)
+            arc2 = compass.draw_segments((0.35 * TAU, 0.45 * TAU), (0.55 * TAU, 0.65 * TAU))
         self.wait()
 
-        # Create arc intersection points
-        ints = arc_intersection(self, arc1[1], arc2[0])
-        p1 = Dot(ints[0] + (0,))
-        p2 = Dot(ints[1] + (0,))
+        # Create arc intersection points, where each pair of arcs actually crosses
+        p1 = Dot(arc_intersection(self, arc1[0], arc2[1])[0] + (0,))
+        p2 = Dot(arc_intersection(self, arc1[1], arc2[0])[0] + (0,))
         self.play(Create(p1), Create(p2))
         self.wait()
 
         # Connect intersection points to form perpendicular bisector
+        self.next_section("Bisector")
         perp_bis = Line(p1.get_center(), p2.get_center())
         self.add_foreground_mobjects(line, perp_bis)
         self.play(Create(perp_bis))
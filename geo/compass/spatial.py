@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from itertools import combinations
+from math import floor, hypot
+from typing import Any, Iterator
+from weakref import WeakKeyDictionary
+
+from geometry import arc_bounds
+
+_scene_indexes: WeakKeyDictionary = WeakKeyDictionary()
+
+
+class SpatialIndex:
+    """A uniform grid over arc bounding boxes and point positions.
+
+    Lets a construction find the arcs that can possibly intersect, and the
+    existing point nearest to a position, without comparing every pair.
+    """
+
+    def __init__(self, cell_size: float = 1.0):
+        self.cell_size = cell_size
+
+        self.arcs: list[Any] = []
+        self.bounds: list[tuple[float, float, float, float]] = []
+        self._arc_cells: defaultdict[tuple[int, int], list[int]] = defaultdict(list)
+
+        self.points: list[tuple[float, float, Any]] = []
+        self._point_cells: defaultdict[tuple[int, int], list[int]] = defaultdict(list)
+
+    @classmethod
+    def for_scene(cls, scene: Any) -> SpatialIndex:
+        """The index shared by everything constructed in a scene."""
+        if scene not in _scene_indexes:
+            _scene_indexes[scene] = cls()
+        return _scene_indexes[scene]
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return floor(x / self.cell_size), floor(y / self.cell_size)
+
+    def _cells(
+        self, x_min: float, y_min: float, x_max: float, y_max: float
+    ) -> Iterator[tuple[int, int]]:
+        i_min, j_min = self._cell(x_min, y_min)
+        i_max, j_max = self._cell(x_max, y_max)
+        for i in range(i_min, i_max + 1):
+            for j in range(j_min, j_max + 1):
+                yield i, j
+
+    def add_arc(self, arc: Any) -> None:
+        """Indexes an arc by the bounding box of its angular extent."""
+        bounds = arc_bounds(arc.get_arc_center(), arc.radius, arc.start_angle, arc.angle)
+
+        self.arcs.append(arc)
+        self.bounds.append(bounds)
+        for cell in self._cells(*bounds):
+            self._arc_cells[cell].append(len(self.arcs) - 1)
+
+    def add_point(self, point: Any, item: Any = None) -> None:
+        """Indexes a point, along with the object it belongs to."""
+        x, y = float(point[0]), float(point[1])
+
+        self.points.append((x, y, item))
+        self._point_cells[self._cell(x, y)].append(len(self.points) - 1)
+
+    def candidate_pairs(self) -> list[tuple[Any, Any]]:
+        """Pairs of arcs whose bounding boxes overlap.
+
+        Only these pairs can intersect; every other pair is guaranteed not to.
+        """
+
+        pairs = set()
+        for indices in self._arc_cells.values():
+            for i, j in combinations(indices, 2):
+                a, b = self.bounds[i], self.bounds[j]
+                if a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]:
+                    pairs.add((min(i, j), max(i, j)))
+
+        return [(self.arcs[i], self.arcs[j]) for i, j in sorted(pairs)]
+
+    def nearest_point(
+        self, point: Any, tolerance: float
+    ) -> tuple[tuple[float, float], Any] | None:
+        """The indexed point nearest to ``point``, if one is within ``tolerance``.
+
+        Returns the point's ``(x, y)`` and the object it was indexed with.
+        """
+
+        x, y = float(point[0]), float(point[1])
+
+        nearest = None
+        nearest_distance = tolerance
+        for cell in self._cells(x - tolerance, y - tolerance, x + tolerance, y + tolerance):
+            for index in self._point_cells.get(cell, ()):
+                px, py, item = self.points[index]
+                distance = hypot(px - x, py - y)
+                if distance <= nearest_distance:
+                    nearest, nearest_distance = ((px, py), item), distance
+
+        return nearest
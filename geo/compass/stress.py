@@ -0,0 +1,48 @@
+from manim import *
+from compass import Compass
+
+
+class ManySegments(Scene):
+    """One sweep drawing a ring of many short arcs."""
+
+    segments = 120
+
+    def construct(self):
+        compass = Compass(self, radius=3)
+
+        step = TAU / self.segments
+        compass.draw_segments(*[(i * step, (i + 0.5) * step) for i in range(self.segments)])
+        self.wait()
+
+
+class ManyCompasses(Scene):
+    """Lots of compasses on screen at once, each drawing a circle."""
+
+    rows = 4
+    columns = 6
+
+    def construct(self):
+        compasses = [
+            Compass(self, center=(2 * column - 5, 2 * row - 3), radius=0.8)
+            for row in range(self.rows)
+            for column in range(self.columns)
+        ]
+
+        for compass in compasses:
+            compass.draw_segments((0, TAU))
+        self.wait()
+
+
+class LongSweep(Scene):
+    """One compass sweeping many times, leaving every arc on screen (merged
+    into a couple of paths)."""
+
+    sweeps = 20
+
+    def construct(self):
+        compass = Compass(self, radius=0.5, merge_traces=True)
+
+        for i in range(self.sweeps):
+            compass.set_radius(0.5 + 0.15 * i)
+            compass.draw_segments((0.1 * TAU, 0.4 * TAU), (0.6 * TAU, 0.9 * TAU))
+        self.wait()
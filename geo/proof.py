@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import NamedTuple, Sequence
+
+from manim import *
+from numpy import ndarray
+
+# The compass modules import each other by name, so their folder goes on the
+# path as it is when rendering from it
+COMPASS = str(Path(__file__).resolve().parent / "compass")
+if COMPASS not in sys.path:
+    sys.path.insert(0, COMPASS)
+
+from geometry import intersect_lines  # noqa: E402
+
+
+def angle_vertex(angle: Angle) -> ndarray:
+    """Where an angle's two lines meet, for scaling the angle in place."""
+    return intersect_lines(
+        *angle.lines[0].get_start_and_end(),
+        *angle.lines[1].get_start_and_end(),
+    )
+
+
+class Emphasis(NamedTuple):
+    """A diagram mobject to highlight while a step is explained.
+
+    Scaled mobjects grow by ``scale`` about ``pivot``, which should be
+    computed once up front (scaling about it leaves it in place).
+    """
+
+    mobject: Mobject
+    color: ParsableManimColor = YELLOW_D
+    rest_color: ParsableManimColor = WHITE
+    scale: float = 1.0
+    pivot: ndarray | None = None
+
+
+class Substitution(NamedTuple):
+    """Replaces a term of one step's statement with terms of another's.
+
+    ``variable`` is the part of the ``source`` statement equal to the
+    ``destination`` part of the target; it's swapped for ``terms``.
+    """
+
+    source: str
+    variable: int
+    terms: tuple[int, ...]
+    destination: int
+
+
+class Step(NamedTuple):
+    """One step of a proof: a statement, its justification and what it highlights.
+
+    Mobjects in ``creates`` are drawn in their emphasized state, so any of
+    them also in ``emphasis`` only get restored afterwards. With
+    ``foreground``, they're moved in front of the diagram once drawn, and with
+    ``create_justification``, the justification is drawn along with them
+    instead of fading in with the statement.
+    """
+
+    name: str
+    statement: tuple[str, ...]
+    justification: str | None = None
+    justification_below: bool = False
+    terms: tuple[tuple[int, ParsableManimColor], ...] = ()
+    creates: tuple[Mobject, ...] = ()
+    foreground: bool = False
+    create_justification: bool = False
+    emphasis: tuple[Emphasis, ...] = ()
+    hold: float = 2
+    target: str | None = None
+    substitutions: tuple[Substitution, ...] = ()
+
+
+class Proof:
+    """Plays a list of proof steps on a scene.
+
+    Every ``Tex`` is built when the proof is, and identical ones are shared,
+    so steps with the same justification reuse one mobject.
+    """
+
+    def __init__(
+        self, scene: Scene, steps: Sequence[Step], statement: Mobject | None = None
+    ):
+        self.scene = scene
+        self.steps = {step.name: step for step in steps}
+        self._tex: dict[tuple, Tex] = {}
+
+        self.statements = {
+            step.name: self.tex(*step.statement).to_corner() for step in steps
+        }
+        self.justifications = {
+            step.name: self._justification(step) if step.justification else None
+            for step in steps
+        }
+
+        # What's currently on screen
+        self.statement = statement
+        self.justification: Tex | None = None
+
+    def tex(self, *strings: str, **kwargs) -> Tex:
+        key = (strings, tuple(sorted(kwargs.items())))
+        if key not in self._tex:
+            self._tex[key] = Tex(*strings, **kwargs)
+        return self._tex[key]
+
+    def _justification(self, step: Step) -> Tex:
+        justification = self.tex(
+            step.justification, font_size=30, tex_environment="flushleft"
+        )
+        if step.justification_below:
+            return justification.next_to(self.statements[step.name], DOWN / 2)
+        return justification.to_corner(UL)
+
+    def introduce(self, name: str, *animations: Animation) -> None:
+        """Swaps the current statement and justification for the step's."""
+        step = self.steps[name]
+        statement = self.statements[name]
+        justification = self.justifications[name]
+
+        swaps = [FadeIn(statement)]
+        if self.statement is not None:
+            swaps.append(FadeOut(self.statement))
+        if justification is not self.justification:
+            if self.justification is not None:
+                swaps.append(FadeOut(self.justification))
+            if justification is not None and not step.create_justification:
+                swaps.append(FadeIn(justification))
+
+        self.scene.play(*swaps, *animations)
+        self.statement, self.justification = statement, justification
+
+    def transform(self, name: str, *animations: Animation) -> None:
+        """Rewrites the current statement into the step's, matching shared terms."""
+        statement = self.statements[name]
+        justification = self.justifications[name]
+
+        if self.justification is not None:
+            self.scene.remove(self.justification)
+        created = [Create(justification)] if justification is not None else []
+
+        self.scene.play(
+            TransformMatchingTex(self.statement, statement), *created, *animations
+        )
+        self.statement, self.justification = statement, justification
+
+    def emphasize(self, name: str, *animations: Animation) -> None:
+        """Highlights the step's terms and diagram, then holds."""
+        step = self.steps[name]
+        statement = self.statements[name]
+
+        created = [Create(mobject) for mobject in step.creates]
+        if step.create_justification and self.justifications[name] is not None:
+            created.append(Create(self.justifications[name]))
+        terms = [statement[i].animate.set_color(color) for i, color in step.terms]
+        highlights = [
+            self._emphasis(emphasis, emphasis.color, emphasis.scale)
+            for emphasis in step.emphasis
+            if emphasis.mobject not in step.creates
+        ]
+
+        self.scene.play(*created, *terms, *highlights, *animations)
+        if step.foreground:
+            self.scene.add_foreground_mobjects(*step.creates)
+        self.scene.wait(step.hold)
+
+    def restore(self, name: str, *animations: Animation) -> None:
+        """Returns the step's terms and diagram to their resting look."""
+        step = self.steps[name]
+        self.scene.play(
+            FadeToColor(self.statements[name], WHITE),
+            *(
+                self._emphasis(emphasis, emphasis.rest_color, 1 / emphasis.scale)
+                for emphasis in step.emphasis
+            ),
+            *animations,
+        )
+
+    def play(self, name: str) -> None:
+        """Introduces, emphasizes and restores a step."""
+        self.introduce(name)
+        self.scene.wait(0.3)
+        self.emphasize(name)
+        self.restore(name)
+
+    def _emphasis(
+        self, emphasis: Emphasis, color: ParsableManimColor, scale: float
+    ) -> Animation:
+        if emphasis.scale == 1:
+            return FadeToColor(emphasis.mobject, color)
+        return emphasis.mobject.animate.scale(
+            scale, about_point=emphasis.pivot
+        ).fade_to(color, 1)
+
+    def substitute(self, name: str) -> VGroup:
+        """Substitutes into the step's target statement, relabels it as this
+        step, and returns the resulting equation."""
+
+        step = self.steps[name]
+        target = self.statements[step.target]
+        equation = VGroup(*target)
+
+        for substitution in step.substitutions:
+            source = self.statements[substitution.source]
+            variable = source[substitution.variable]
+            to_move = VGroup(*(source[i] for i in substitution.terms))
+            destination = target[substitution.destination]
+            rest = VGroup(*target.submobjects[substitution.destination + 1:])
+
+            position = equation.submobjects.index(destination)
+            equation.remove(destination)
+
+            # Highlight equal variables
+            self.scene.play(
+                variable.animate.set_color(YELLOW_D),
+                destination.animate.set_color(YELLOW_D),
+            )
+            self.scene.wait(0.3)
+
+            self.scene.play(
+                variable.animate.set_color(WHITE), to_move.animate.set_color(YELLOW_D)
+            )
+            self.scene.wait(0.3)
+
+            # Move a copy of the terms into place, making room after it
+            moving = to_move.copy()
+            moved = moving.copy().move_to(destination, aligned_edge=LEFT)
+
+            self.scene.play(
+                FadeOut(destination),
+                ReplacementTransform(moving, moved),
+                *([rest.animate.next_to(moved, RIGHT)] if len(rest) else []),
+            )
+            equation.insert(position, moved)
+            self.scene.wait(0.3)
+
+            # Fade colors back to normal
+            self.scene.play(
+                to_move.animate.set_color(WHITE),
+                moved.animate.set_color(WHITE),
+            )
+
+        # Change the step number
+        label = self.statements[name].move_to(target[0])
+        self.scene.play(ReplacementTransform(target[0], label))
+        equation.remove(target[0])
+        equation.insert(0, label)
+
+        self.statement = equation
+        return equation
@@ -1,21 +1,43 @@
+import sys
+from pathlib import Path
+
 from manim import *
 from numpy import array
 
+# The compass modules import each other by name, so their folder goes on the
+# path as it is when rendering from it
+COMPASS = str(Path(__file__).resolve().parent / "compass")
+if COMPASS not in sys.path:
+    sys.path.insert(0, COMPASS)
+
+from core import screen_tolerance  # noqa: E402
+from geometry import arc_components, circle_points, intersect_lines  # noqa: E402
+from proof import Emphasis, Proof, Step, Substitution, angle_vertex  # noqa: E402
+
 
 class Main(MovingCameraScene):
     def construct(self):
 
+        # Tessellate arcs to within half a pixel at the current zoom
+        tolerance = screen_tolerance(self.camera, 0.5)
+
         # Setup problem
-        circle = Circle(radius=2, color=PINK)
+        circle = Circle(
+            radius=2, color=PINK, num_components=arc_components(2, TAU, tolerance)
+        )
 
         line1 = TangentLine(circle, alpha=0.16, length=6.2, color=GREY_A)
         line2 = TangentLine(circle, alpha=0.84, length=6.2, color=GREY_A)
 
-        dotA = Dot(circle.point_from_proportion(0.16))
-        dotB = Dot(circle.point_from_proportion(0.84))
-        dotC = Dot(circle.point_from_proportion(0.4))
+        # On the true circle, where the arcs below end, whatever its tessellation
+        pointA, pointB, pointC = circle_points(
+            circle.get_center(), 2, [0.16, 0.84, 0.4]
+        )
+        dotA = Dot(pointA)
+        dotB = Dot(pointB)
+        dotC = Dot(pointC)
         dotP = Dot(
-            line_intersection([line1.start, line1.end], [line2.start, line2.end])
+            intersect_lines(line1.start, line1.end, line2.start, line2.end)
         )
 
         textA = Tex("A").next_to(dotA, UR / 3)
@@ -28,6 +50,7 @@ class Main(MovingCameraScene):
             start_angle=0.16 * TAU,
             angle=-0.32 * TAU,
             radius=2,
+            num_components=arc_components(2, -0.32 * TAU, tolerance),
             arc_center=circle.get_center(),
             color=RED_A,
         )
@@ -36,6 +59,7 @@ class Main(MovingCameraScene):
             start_angle=0.84 * TAU,
             angle=-0.68 * TAU,
             radius=2,
+            num_components=arc_components(2, -0.68 * TAU, tolerance),
             arc_center=circle.get_center(),
             color=RED_E,
         )
@@ -100,53 +124,9 @@ class Main(MovingCameraScene):
             FadeToColor(problem_text, WHITE),
         )
 
-        # Step 1: draw aux AB (text)
-        step1 = (Tex("1) Draw auxiliary ", r"$\overline{AB}$")).to_corner()
-
-        details1 = Tex(
-            "AUX | through any 2 points there is exactly one line",
-            font_size=30,
-            tex_environment="flushleft",
-        ).to_corner(UL)
-
-        # Replace problem text with Step 1
-        self.play(
-            FadeOut(problem_text), FadeIn(step1), step1[1].animate.set_color(YELLOW_D)
-        )
-        self.wait(0.3)
-
-        # Draw AUX on animation
+        # Diagram mobjects the proof adds
         aux = Line(dotA.get_center(), dotB.get_center(), color=YELLOW_D)
-        self.play(Create(aux), Create(details1))
-        self.wait(3)
-
-        # Fade Step 1 mobjects to white
-        self.play(FadeToColor(aux, WHITE), FadeToColor(step1, WHITE))
-
-        # Step 2: Exterior angles (text)
-
-        # TODO: animate the exterior angle, and then the 2 remote ints
-
-        step2 = Tex(
-            "2) ", r"$m\angle{1}$", " $+$ ", r"$m\angle{2}$", " $=$ ", r"$m\angle{3}$"
-        ).to_corner()
-
-        details2 = Tex(
-            r"the measure of an exterior angle of a triangle = the sum of the measures of the 2 remote interior angles",
-            tex_environment="flushleft",
-            font_size=30,
-        ).to_corner(UL)
 
-        # Replace Step 1 with Step 2
-        self.play(
-            FadeOut(details1),
-            FadeIn(details2),
-            FadeOut(step1),
-            FadeIn(step2),
-        )
-        self.wait(0.3)
-
-        # Construct exterior angle
         angle3 = Angle(
             line2, aux, quadrant=array([-1, -1]), other_angle=True, color=ORANGE
         )
@@ -158,196 +138,160 @@ class Main(MovingCameraScene):
         angle2text = Tex("2", color=YELLOW_D).next_to(angle2, (DR + LEFT * 1 / 2) / 2)
 
         group1 = VGroup(angle1, angle1text)
+        group2 = VGroup(angle2, angle2text)
+        group3 = VGroup(angle3, angle3text)
 
-        self.play(
-            Create(angle3),
-            Create(angle3text),
-            Create(angle2),
-            Create(angle2text),
-            step2[1].animate.set_color(YELLOW_D),
-            step2[5].animate.set_color(ORANGE),
-            # fmt: skip
-            group1.animate.scale(
-                1.6,
-                about_point=line_intersection(
-                    group1[0].lines[0].get_start_and_end(),
-                    group1[0].lines[1].get_start_and_end(),
-                ),
-            ).fade_to(YELLOW_D, 1),
-            step2[3].animate.set_color(YELLOW_D),
+        # Each angle grows about its vertex, which stays put
+        pivot1, pivot2, pivot3 = (
+            angle_vertex(angle) for angle in (angle1, angle2, angle3)
         )
-        self.wait(2)
 
-        # Fade Step 2's new diagram mobjects
-        group2 = VGroup(angle2, angle2text)
-        group3 = VGroup(angle3, angle3text)
+        segmentB = Line(dotB.get_center(), line2.get_start(), color=YELLOW_D)
+        segmentA = Line(dotA.get_center(), dotP.get_center(), color=YELLOW_D)
 
-        for group in (group1, group2, group3):
-            self.play(
-                group.animate.scale(
-                    0.625,
-                    about_point=line_intersection(
-                        group[0].lines[0].get_start_and_end(),
-                        group[0].lines[1].get_start_and_end(),
+        chord_tangent = "the measure of an angle formed by a chord and a tangent equals half the measures of the intercepted arc"
+
+        proof = Proof(
+            self,
+            [
+                Step(
+                    "Step 1",
+                    ("1) Draw auxiliary ", r"$\overline{AB}$"),
+                    "AUX | through any 2 points there is exactly one line",
+                    terms=((1, YELLOW_D),),
+                    creates=(aux,),
+                    create_justification=True,
+                    emphasis=(Emphasis(aux),),
+                    hold=3,
+                ),
+                Step(
+                    "Step 2",
+                    (
+                        "2) ",
+                        r"$m\angle{1}$",
+                        " $+$ ",
+                        r"$m\angle{2}$",
+                        " $=$ ",
+                        r"$m\angle{3}$",
                     ),
-                ).fade_to(WHITE, 1),
-            )
-        self.play(step2.animate.set_color(WHITE))
+                    r"the measure of an exterior angle of a triangle = the sum of the measures of the 2 remote interior angles",
+                    terms=((1, YELLOW_D), (3, YELLOW_D), (5, ORANGE)),
+                    creates=(group2, group3),
+                    emphasis=(
+                        Emphasis(group1, scale=1.6, pivot=pivot1),
+                        Emphasis(group2, scale=1.6, pivot=pivot2),
+                        Emphasis(group3, scale=1.6, pivot=pivot3),
+                    ),
+                ),
+                Step(
+                    "Step 3",
+                    (
+                        "3) ",
+                        r"$m\angle{1}$",
+                        " $=$ ",
+                        r"$m\angle{3}$",
+                        " $-$ ",
+                        r"$m\angle{2}$",
+                    ),
+                    "subtraction property of equality",
+                    justification_below=True,
+                ),
+                Step(
+                    "Step 4",
+                    (
+                        "4) ",
+                        r"m$\angle{3}$",
+                        " $=$ ",
+                        r"$\dfrac{1}{2}$",
+                        r"$m\overset{\frown}{ACB}$",
+                    ),
+                    chord_tangent,
+                    terms=((1, YELLOW_D), (4, ORANGE)),
+                    creates=(segmentB,),
+                    foreground=True,
+                    emphasis=(
+                        Emphasis(segmentB),
+                        Emphasis(arcX, ORANGE),
+                        Emphasis(aux),
+                        Emphasis(group3, scale=1.6, pivot=pivot3),
+                    ),
+                ),
+                Step(
+                    "Step 5",
+                    (
+                        "5) ",
+                        r"$m\angle{2}$",
+                        " $=$ ",
+                        r"$\dfrac{1}{2}$",
+                        r"$m\overset{\frown}{AB}$",
+                    ),
+                    chord_tangent,
+                    terms=((1, YELLOW_D), (4, ORANGE)),
+                    creates=(segmentA,),
+                    foreground=True,
+                    emphasis=(
+                        Emphasis(segmentA),
+                        Emphasis(arcY, ORANGE),
+                        Emphasis(aux),
+                        Emphasis(group2, scale=1.6, pivot=pivot2),
+                    ),
+                ),
+                Step(
+                    "Step 6",
+                    ("6) ",),
+                    target="Step 3",
+                    substitutions=(
+                        Substitution("Step 4", 1, (3, 4), 3),  # [1/2 measure of arc ACB]
+                        Substitution("Step 5", 1, (3, 4), 5),  # [1/2 measure of arc AB]
+                    ),
+                ),
+            ],
+            statement=problem_text,
+        )
+        step3, step4, step5 = (proof.statements[f"Step {n}"] for n in (3, 4, 5))
+
+        # Step 1: draw aux AB
+        self.next_section("Step 1")
+        proof.play("Step 1")
+
+        # Step 2: exterior angles
+        # TODO: animate the exterior angle, and then the 2 remote ints
+        self.next_section("Step 2")
+        proof.play("Step 2")
         self.wait()
 
         self.camera.frame.save_state()
+        self.next_section("Step 3")
         # Zoom in on equation
-        temp_del = [m for m in self.mobjects if m is not step2]
+        temp_del = [m for m in self.mobjects if m is not proof.statement]
         self.play(
             FadeOut(*temp_del),
-            self.camera.frame.animate.scale(0.75).move_to(step2),
+            self.camera.frame.animate.scale(0.75).move_to(proof.statement),
         )
         self.remove(*temp_del)
 
         # Edit equation
-        step3 = Tex(
-            "3) ", r"$m\angle{1}$", " $=$ ", r"$m\angle{3}$", " $-$ ", r"$m\angle{2}$"
-        ).to_corner()
-
-        details3 = Tex(
-            "subtraction property of equality",
-            tex_environment="flushleft",
-            font_size=30,
-        ).next_to(step3, DOWN / 2)
-
-        self.play(TransformMatchingTex(step2, step3), Create(details3))
+        proof.transform("Step 3")
         self.wait(2)
 
         # Fade in all the temporarily deleted mobjects and move the camera back to normal
+        details2 = proof.justifications["Step 2"]
         self.play(
-            FadeIn(*temp_del),
-            FadeOut(details2),
+            FadeIn(*(m for m in temp_del if m is not details2)),
             self.camera.frame.animate.scale(4 / 3).move_to(ORIGIN),
         )
-        self.remove(details2)
-
-        # Step 4: chord & tangent (text)
-        step4 = Tex(
-            "4) ",
-            r"m$\angle{3}$",
-            " $=$ ",
-            r"$\dfrac{1}{2}$",
-            r"$m\overset{\frown}{ACB}$",
-        ).to_corner()
-
-        details4 = Tex(
-            "the measure of an angle formed by a chord and a tangent equals half the measures of the intercepted arc",
-            tex_environment="flushleft",
-            font_size=30,
-        ).to_corner(UL)
-
-        # Replace Step 3 with Step 4
-        self.play(
-            FadeOut(step3),
-            FadeIn(step4),
-            FadeOut(details3),
-            FadeIn(details4),
-        )
-        self.play(
-            step4[1].animate.set_color(YELLOW_D),
-            step4[4].animate.set_color(ORANGE),
-        )
-        self.wait(0.3)
-
-        # Highlight line segments & angles
-        temp_segment = Line(dotB.get_center(), line2.get_start(), color=YELLOW_D)
-        self.add_foreground_mobject(temp_segment)
-
-        self.play(
-            Create(temp_segment),
-            FadeToColor(arcX, ORANGE),
-            FadeToColor(aux, YELLOW_D),
-            group3.animate.scale(
-                1.6,
-                about_point=line_intersection(
-                    line2.get_start_and_end(),
-                    aux.get_start_and_end(),
-                ),
-            ).fade_to(YELLOW_D, 1),
-        )
-
-        self.wait(2)
-
-        # Fade colors back to normal
-        self.play(
-            FadeToColor(arcX, WHITE),
-            FadeToColor(temp_segment, WHITE),
-            FadeToColor(aux, WHITE),
-            FadeToColor(step4, WHITE),
-            group3.animate.scale(
-                0.625,
-                about_point=line_intersection(
-                    line2.get_start_and_end(),
-                    aux.get_start_and_end(),
-                ),
-            ).fade_to(WHITE, 1),
-        )
-
-        # Change temp segment
-        self.remove(temp_segment)
-
-        temp_segment = Line(dotA.get_center(), dotP.get_center(), color=YELLOW_D)
-
-        # Step 5: Step 4, but with another angle (text)
-        step5 = Tex(
-            "5) ",
-            r"$m\angle{2}$",
-            " $=$ ",
-            r"$\dfrac{1}{2}$",
-            r"$m\overset{\frown}{AB}$",
-        ).to_corner()
-        details5 = details4
-
-        # Replace Step 4 with Step 5
-        self.play(
-            FadeOut(step4),
-            FadeIn(step5),
-            FadeIn(details5),
-        )
-        self.play(
-            step5[1].animate.set_color(YELLOW_D),
-            step5[4].animate.set_color(ORANGE),
-        )
 
-        # Add / recolor Step 5 elements
-        self.play(
-            Create(temp_segment),
-            FadeToColor(arcY, ORANGE),
-            FadeToColor(aux, YELLOW_D),
-            group2.animate.scale(
-                1.6,
-                about_point=line_intersection(
-                    line1.get_start_and_end(),
-                    aux.get_start_and_end(),
-                ),
-            ).fade_to(YELLOW_D, 1),
-        )
-        self.add_foreground_mobject(temp_segment)
-
-        self.wait(2)
-
-        # Fade colors back to normal
-        self.play(
-            FadeToColor(arcY, WHITE),
-            FadeToColor(temp_segment, WHITE),
-            FadeToColor(aux, WHITE),
-            FadeToColor(step5, WHITE),
-            group2.animate.scale(
-                0.625,
-                about_point=line_intersection(
-                    line1.get_start_and_end(),
-                    aux.get_start_and_end(),
-                ),
-            ).fade_to(WHITE, 1),
-        )
+        # Step 4: chord & tangent
+        self.next_section("Step 4")
+        proof.play("Step 4")
+        self.remove(segmentB)
 
+        # Step 5: Step 4, but with another angle
+        self.next_section("Step 5")
+        proof.play("Step 5")
         self.wait(1)
 
+        self.next_section("Step 6")
         # Zoom in on equation
         temp_del = [m for m in self.mobjects if m is not step5]
         self.play(
@@ -361,94 +305,7 @@ class Main(MovingCameraScene):
             Create(step4.next_to(step5, DOWN)),
             Create(step3.next_to(step4, DOWN * 4 / 3)),
         )
-
-        # FIRST SUBSTITUTION (Step 3, Step 4)
-        final_equation = VGroup(*[step3[i] for i in range(len(step3.submobjects))])
-
-        to_move = VGroup(step4[3], step4[4])  # [1/2 measure of arc ACB]
-        destination = step3[3]  # [measure of angle 3]
-        final_equation.remove(destination)
-
-        # Highlight equal variables
-        self.play(
-            step4[1].animate.set_color(YELLOW_D),
-            destination.animate.set_color(YELLOW_D),
-        )
-        self.wait(0.3)
-
-        self.play(
-            step4[1].animate.set_color(WHITE), to_move.animate.set_color(YELLOW_D)
-        )
-        self.wait(0.3)
-
-        # Make dummies for movement
-        dummy1 = to_move.copy()
-        dummy2 = dummy1.copy().move_to(destination, aligned_edge=LEFT)
-
-        self.play(
-            FadeOut(destination),  # Fade out [measure of angle 3] in Step 3
-            ReplacementTransform(
-                dummy1, dummy2
-            ),  # Animate moving [1/2 measure of arc ACB] from Step 4 to Step 3
-            VGroup(*step3[4:]).animate.next_to(
-                dummy2, RIGHT
-            ),  # Move everything after the transformation
-        )
-        final_equation.insert(3, dummy2)
-
-        self.wait(0.3)
-
-        # Fade colors back to normal
-        self.play(
-            to_move.animate.set_color(WHITE),
-            dummy2.animate.set_color(WHITE),
-        )
-
-        # SECOND SUBSTITUTION (Step 5, Step 3)
-
-        to_move = VGroup(step5[3], step5[4])  # [1/2 measure of arc AB]
-        destination = step3[5]  # [measure of angle 2]
-        final_equation.remove(destination)
-
-        # Highlight equal variables
-        self.play(
-            step5[1].animate.set_color(YELLOW_D),
-            destination.animate.set_color(YELLOW_D),
-        )
-        self.wait(0.3)
-
-        self.play(
-            step5[1].animate.set_color(WHITE), to_move.animate.set_color(YELLOW_D)
-        )
-        self.wait(0.3)
-
-        # Make dummies for movement
-        dummy1 = to_move.copy()
-        dummy2 = dummy1.copy().move_to(destination, aligned_edge=LEFT)
-        final_equation.insert(6, dummy2)
-
-        self.play(
-            FadeOut(destination),  # Fade out [measure of angle 2] in Step 3
-            ReplacementTransform(
-                dummy1, dummy2
-            ),  # Animate moving [1/2 measure of arc AB] from Step 5 to Step 3
-        )
-
-        self.wait(0.3)
-
-        # Fade colors back to normal
-        self.play(
-            to_move.animate.set_color(WHITE),
-            dummy2.animate.set_color(WHITE),
-        )
-
-        # Change step number from 3 to 6
-        destination = step3[0]
-        step6_label = Tex("6) ").move_to(destination)
-        self.play(ReplacementTransform(destination, step6_label))
-        final_equation.remove(destination)
-
-        final_equation.insert(0, step6_label)
+        final_equation = proof.substitute("Step 6")
         self.wait(1)
 
         self.play(Uncreate(step4), Uncreate(step5))
@@ -0,0 +1,4 @@
+"""Rendering tools shared by the algebra and geometry scenes.
+
+Run from the repository root with ``python -m rendering --help``.
+"""
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from rendering.scenes import QUALITIES, configure
+
+
+def tex(args: argparse.Namespace) -> None:
+    from rendering.tex import prewarm
+
+    for scene_file in args.scene_files:
+        configure(scene_file)
+        count = prewarm(scene_file, scan=args.scan)
+        print(f"{scene_file}: compiled {count} Tex expressions")
+
+
+def render(args: argparse.Namespace) -> None:
+    from rendering.sections import render_parallel
+
+    print(
+        render_parallel(
+            args.scene_file, args.scene_name, args.workers, args.quality, args.layers
+        )
+    )
+
+
+def bench(args: argparse.Namespace) -> None:
+    from rendering.bench import BASELINE, CASES, report
+
+    ok = report(
+        args.cases or list(CASES),
+        Path(args.baseline) if args.baseline else BASELINE,
+        args.threshold,
+        args.save_baseline,
+    )
+    sys.exit(0 if ok else 1)
+
+
+def profile(args: argparse.Namespace) -> None:
+    from rendering.layers import layer_cached
+    from rendering.profile import profile_updaters
+    from rendering.scenes import load_scene
+
+    configure(args.scene_file, args.quality)
+    output = args.output or f"{args.scene_name}_updaters.json"
+
+    scene_class = load_scene(args.scene_file, args.scene_name)
+    if args.layers:
+        scene_class = layer_cached(scene_class)
+
+    with profile_updaters(output):
+        scene_class().render()
+    print(output)
+
+
+def batch(args: argparse.Namespace) -> None:
+    from rendering.batch import render_batch, report
+
+    summary = render_batch(
+        args.scene_file, args.scene_name, args.problem_file, args.workers, args.quality
+    )
+    report(summary)
+
+
+def render_from(args: argparse.Namespace) -> None:
+    from rendering.sections import render_from
+
+    print(
+        render_from(
+            args.scene_file,
+            args.scene_name,
+            args.section,
+            args.quality,
+            args.layers,
+            args.pipeline_tex,
+            args.scan_tex,
+        )
+    )
+
+
+def export(args: argparse.Namespace) -> None:
+    from rendering.export import export
+
+    print(
+        export(
+            args.scene_file, args.scene_name, args.output, args.section, args.quality
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m rendering")
+    commands = parser.add_subparsers(required=True)
+
+    tex_parser = commands.add_parser(
+        "tex", help="compile a scene's Tex in one LaTeX run to warm the Tex cache"
+    )
+    tex_parser.add_argument("scene_files", nargs="+")
+    tex_parser.add_argument(
+        "--scan",
+        action="store_true",
+        help="only scan the source for Tex instead of running the scenes",
+    )
+    tex_parser.set_defaults(run=tex)
+
+    render_parser = commands.add_parser(
+        "render", help="render a scene's sections in parallel and join them"
+    )
+    render_parser.add_argument("scene_file")
+    render_parser.add_argument("scene_name")
+    render_parser.add_argument("-q", "--quality", choices=QUALITIES)
+    render_parser.add_argument("-j", "--workers", type=int)
+    render_parser.add_argument(
+        "--layers", action="store_true", help="cache static mobjects as raster layers"
+    )
+    render_parser.set_defaults(run=render)
+
+    bench_parser = commands.add_parser(
+        "bench", help="render benchmark scenes headlessly and compare with a baseline"
+    )
+    bench_parser.add_argument("cases", nargs="*", help="cases to run (default: all)")
+    bench_parser.add_argument("--baseline", help="baseline JSON file")
+    bench_parser.add_argument(
+        "--threshold", type=float, default=0.1, help="allowed slowdown, as a fraction"
+    )
+    bench_parser.add_argument(
+        "--save-baseline", action="store_true", help="store the results as the baseline"
+    )
+    bench_parser.set_defaults(run=bench)
+
+    profile_parser = commands.add_parser(
+        "profile", help="render a scene while timing every updater"
+    )
+    profile_parser.add_argument("scene_file")
+    profile_parser.add_argument("scene_name")
+    profile_parser.add_argument("-q", "--quality", choices=QUALITIES)
+    profile_parser.add_argument("-o", "--output", help="JSON report path")
+    profile_parser.add_argument(
+        "--layers", action="store_true", help="cache static mobjects as raster layers"
+    )
+    profile_parser.set_defaults(run=profile)
+
+    batch_parser = commands.add_parser(
+        "batch", help="render a template scene once per problem in a problem list"
+    )
+    batch_parser.add_argument("scene_file")
+    batch_parser.add_argument("scene_name")
+    batch_parser.add_argument("problem_file", help="JSON list of problems")
+    batch_parser.add_argument("-q", "--quality", choices=QUALITIES)
+    batch_parser.add_argument("-j", "--workers", type=int)
+    batch_parser.set_defaults(run=batch)
+
+    from_parser = commands.add_parser(
+        "render-from", help="render a scene from a section on, skipping earlier ones"
+    )
+    from_parser.add_argument("scene_file")
+    from_parser.add_argument("scene_name")
+    from_parser.add_argument("section", type=int, help="section to render from")
+    from_parser.add_argument("-q", "--quality", choices=QUALITIES)
+    from_parser.add_argument(
+        "--layers", action="store_true", help="cache static mobjects as raster layers"
+    )
+    from_parser.add_argument(
+        "--pipeline-tex",
+        action="store_true",
+        help="compile the scene's Tex in the background while rendering",
+    )
+    from_parser.add_argument(
+        "--scan-tex",
+        action="store_true",
+        help="find the Tex to pipeline by scanning the source (quicker, sees less)",
+    )
+    from_parser.set_defaults(run=render_from)
+
+    export_parser = commands.add_parser(
+        "export", help="write a scene's final diagram to SVG or PDF without rendering"
+    )
+    export_parser.add_argument("scene_file")
+    export_parser.add_argument("scene_name")
+    export_parser.add_argument("-o", "--output", help="SVG or PDF path")
+    export_parser.add_argument(
+        "--section", type=int, help="export the diagram at the start of this section"
+    )
+    export_parser.add_argument("-q", "--quality", choices=QUALITIES)
+    export_parser.set_defaults(run=export)
+
+    args = parser.parse_args()
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
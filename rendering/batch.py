@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any
+
+from manim import config, logger
+
+from rendering.scenes import configure, load_scene
+from rendering.tex import TexRequest, compile_batch, record_scene_tex
+
+
+def load_problems(problem_file: str | Path) -> dict[str, dict[str, Any]]:
+    """Reads a JSON list of problems, keyed by their output names.
+
+    Each problem is passed to the scene's ``with_problem``; an optional
+    ``"name"`` names its video (``problem000``, ``problem001``... otherwise).
+    """
+
+    problems = {}
+    for i, problem in enumerate(json.loads(Path(problem_file).read_text())):
+        problem = dict(problem)
+        problems[problem.pop("name", f"problem{i:03d}")] = problem
+    return problems
+
+
+def record_problem(
+    scene_file: str, scene_name: str, problem: dict[str, Any]
+) -> list[TexRequest]:
+    """Records the Tex one problem's scene builds, in this process."""
+    configure(scene_file)
+    return record_scene_tex(load_scene(scene_file, scene_name).with_problem(problem))
+
+
+def _failure(error: BaseException) -> str:
+    return f"{type(error).__name__}: {error}"
+
+
+def prewarm_problems(
+    scene_file: str,
+    scene_name: str,
+    problems: dict[str, dict[str, Any]],
+    pool: Executor,
+) -> tuple[int, dict[str, str]]:
+    """Compiles the Tex of every problem in one batch, shared terms only once.
+
+    Each problem's Tex is recorded in the pool, by running its scene with
+    every animation skipped. Returns the number of expressions compiled, and
+    the problems whose scenes failed, with their errors.
+    """
+
+    recordings = {
+        name: pool.submit(record_problem, scene_file, scene_name, problem)
+        for name, problem in problems.items()
+    }
+
+    requests: list[TexRequest] = []
+    failed: dict[str, str] = {}
+    for name, recording in recordings.items():
+        try:
+            requests.extend(recording.result())
+        except Exception as error:
+            failed[name] = _failure(error)
+            logger.error("Problem %s failed: %s", name, failed[name])
+
+    configure(scene_file)
+    return compile_batch(requests), failed
+
+
+def render_problem(
+    scene_file: str,
+    scene_name: str,
+    name: str,
+    problem: dict[str, Any],
+    quality: str | None,
+) -> dict[str, Any]:
+    """Renders one problem in this process, returning its timing and movie file."""
+
+    configure(scene_file, quality)
+    config.output_file = name
+
+    scene = load_scene(scene_file, scene_name).with_problem(problem)()
+    start = time.perf_counter()
+    scene.render()
+    seconds = time.perf_counter() - start
+
+    movie = Path(scene.renderer.file_writer.movie_file_path)
+    return {
+        "name": name,
+        "seconds": seconds,
+        "movie": str(movie) if movie.exists() else None,
+    }
+
+
+def render_batch(
+    scene_file: str,
+    scene_name: str,
+    problem_file: str,
+    workers: int | None = None,
+    quality: str | None = None,
+) -> Path:
+    """Renders a video per problem across a process pool.
+
+    The Tex cache is filled before any problem renders, so workers only read
+    it. A problem whose scene fails is reported, and the rest still render.
+    Returns a JSON summary with the time each problem took.
+    """
+
+    problems = load_problems(problem_file)
+
+    start = time.perf_counter()
+
+    # Spawn, so every worker imports manim and the scene fresh
+    with ProcessPoolExecutor(workers, mp_context=get_context("spawn")) as pool:
+        compiled, failed = prewarm_problems(scene_file, scene_name, problems, pool)
+        tex_seconds = time.perf_counter() - start
+        logger.info("Compiled %d Tex expressions in %.1fs", compiled, tex_seconds)
+
+        renders = {
+            name: pool.submit(
+                render_problem, scene_file, scene_name, name, problem, quality
+            )
+            for name, problem in problems.items()
+            if name not in failed
+        }
+
+        results = []
+        for name in problems:
+            if name not in failed:
+                try:
+                    results.append(renders[name].result())
+                except Exception as error:
+                    failed[name] = _failure(error)
+                    logger.error("Problem %s failed: %s", name, failed[name])
+            if name in failed:
+                results.append(
+                    {"name": name, "seconds": None, "movie": None, "error": failed[name]}
+                )
+
+    summary = {
+        "tex": {"expressions": compiled, "seconds": tex_seconds},
+        "problems": results,
+        "seconds": time.perf_counter() - start,
+    }
+    media = Path(scene_file).resolve().parent / "media"
+    media.mkdir(parents=True, exist_ok=True)
+    output = media / f"{Path(problem_file).stem}_summary.json"
+    output.write_text(json.dumps(summary, indent=2))
+    return output
+
+
+def report(summary_file: Path) -> None:
+    summary = json.loads(summary_file.read_text())
+    width = max([len(result["name"]) for result in summary["problems"]] + [7])
+
+    print(f"{'problem':<{width}}  seconds")
+    for result in summary["problems"]:
+        if "error" in result:
+            print(f"{result['name']:<{width}}   failed  {result['error']}")
+            continue
+        failed = "" if result["movie"] else "  (no movie)"
+        print(f"{result['name']:<{width}}  {result['seconds']:7.2f}{failed}")
+
+    tex = summary["tex"]
+    print(f"Tex: {tex['expressions']} expressions compiled in {tex['seconds']:.2f}s")
+    print(f"Total: {summary['seconds']:.2f}s, summary in {summary_file}")
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+import resource
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+from manim import config
+from manim.utils import tex_file_writing
+
+from rendering.scenes import load_scene
+
+ROOT = Path(__file__).resolve().parents[1]
+BASELINE = Path(__file__).with_name("bench_baseline.json")
+
+CASES = {
+    "perp_bis": ("geo/compass/perp_bis.py", "Main"),
+    "geo_scene1": ("geo/scene1.py", "Main"),
+    "alg_scene1": ("alg/scene1.py", "Main"),
+    "many_segments": ("geo/compass/stress.py", "ManySegments"),
+    "many_compasses": ("geo/compass/stress.py", "ManyCompasses"),
+    "long_sweep": ("geo/compass/stress.py", "LongSweep"),
+}
+
+# Whether a bigger number is an improvement
+HIGHER_IS_BETTER = {
+    "fps": True,
+    "wall_s": False,
+    "play_mean_s": False,
+    "play_max_s": False,
+    "peak_rss_mb": False,
+    "tex_s": False,
+}
+
+
+def _timed(function, totals: dict[str, float], key: str):
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            totals[key] += time.perf_counter() - start
+
+    return wrapper
+
+
+def measure(case: str) -> dict[str, float]:
+    """Renders one case headlessly in this process and measures it.
+
+    Renders at a fixed low resolution with a cold Tex cache, writing no
+    video, so results only depend on the code being measured.
+    """
+
+    scene_file, scene_name = CASES[case]
+
+    with tempfile.TemporaryDirectory() as media_dir:
+        config.media_dir = media_dir
+        config.pixel_width = 320
+        config.pixel_height = 180
+        config.frame_rate = 15
+        config.write_to_movie = False
+        config.save_last_frame = False
+        config.disable_caching = True
+
+        totals = {"tex": 0.0}
+        tex_file_writing.compile_tex = _timed(tex_file_writing.compile_tex, totals, "tex")
+        tex_file_writing.convert_to_svg = _timed(tex_file_writing.convert_to_svg, totals, "tex")
+
+        scene = load_scene(ROOT / scene_file, scene_name)()
+
+        frames = 0
+        render_frame = scene.renderer.render
+
+        def counted_render(*args, **kwargs):
+            nonlocal frames
+            frames += 1
+            return render_frame(*args, **kwargs)
+
+        play_times = []
+        play = scene.play
+
+        def timed_play(*args, **kwargs):
+            start = time.perf_counter()
+            play(*args, **kwargs)
+            play_times.append(time.perf_counter() - start)
+
+        scene.renderer.render = counted_render
+        scene.play = timed_play
+
+        start = time.perf_counter()
+        scene.render()
+        wall = time.perf_counter() - start
+
+    return {
+        "fps": frames / wall,
+        "wall_s": wall,
+        "plays": len(play_times),
+        "play_mean_s": sum(play_times) / max(len(play_times), 1),
+        "play_max_s": max(play_times, default=0.0),
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "tex_s": totals["tex"],
+    }
+
+
+def run(cases: list[str]) -> dict[str, dict[str, float]]:
+    """Measures each case in its own fresh process."""
+
+    # One task per process, so peak memory and imports aren't shared
+    context = get_context("spawn")
+    results = {}
+    for case in cases:
+        with ProcessPoolExecutor(1, mp_context=context) as pool:
+            results[case] = pool.submit(measure, case).result()
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], threshold: float
+) -> list[str]:
+    """Describes every metric that got worse than the baseline by more than ``threshold``."""
+
+    regressions = []
+    for case, metrics in results.items():
+        for metric, higher_is_better in HIGHER_IS_BETTER.items():
+            old = baseline.get(case, {}).get(metric)
+            if not old:
+                continue
+
+            change = (metrics[metric] - old) / old
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append(
+                    f"{case} {metric}: {old:.3g} -> {metrics[metric]:.3g} ({change:+.0%})"
+                )
+    return regressions
+
+
+def report(
+    cases: list[str], baseline: Path = BASELINE, threshold: float = 0.1, save: bool = False
+) -> bool:
+    """Runs the benchmarks and prints them against the baseline.
+
+    Returns whether there were no regressions.
+    """
+
+    results = run(cases)
+    print(json.dumps(results, indent=2))
+
+    if save:
+        saved = json.loads(baseline.read_text()) if baseline.exists() else {}
+        saved.update(results)
+        baseline.write_text(json.dumps(saved, indent=2) + "\n")
+        return True
+
+    if not baseline.exists():
+        print(f"No baseline at {baseline}; save one with --save-baseline")
+        return True
+
+    regressions = compare(results, json.loads(baseline.read_text()), threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return not regressions
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import cairo
+from manim import (
+    TAU,
+    CapStyleType,
+    LineJointType,
+    Mobject,
+    PMobject,
+    Scene,
+    VMobject,
+    config,
+)
+from manim.camera.camera import CAP_STYLE_MAP, LINE_JOIN_MAP
+from manim.utils.color import color_to_rgba
+from manim.utils.iterables import list_update
+
+from rendering.scenes import configure, load_scene
+
+# Mobjects (with their families) left out of exported diagrams
+SKIPPED = {"CompassArm", "CompassCenterMark"}
+
+# Play arguments that only concern subcaptions
+_SUBCAPTIONS = ("subcaption", "subcaption_duration", "subcaption_offset")
+
+
+class _Exported(Exception):
+    """Stops a scene at the section being exported."""
+
+
+def jump(scene: Scene, *args: Any, **kwargs: Any) -> None:
+    """Plays animations by jumping straight to their end states, with no frames."""
+
+    for key in _SUBCAPTIONS:
+        kwargs.pop(key, None)
+
+    animations = scene.compile_animations(*args, **kwargs)
+    scene.add_mobjects_from_animations(animations)
+    for animation in animations:
+        animation._setup_scene(scene)
+        animation.begin()
+        animation.finish()
+        animation.clean_up_from_scene(scene)
+
+
+def final_state(scene_class: type[Scene], section: int | None = None) -> Scene:
+    """Runs a scene's construction with every play jumped to its end state.
+
+    With a ``section``, the construction stops at its start. Nothing is
+    rendered either way.
+    """
+
+    class ExportScene(scene_class):
+        def setup(self):
+            self.section_count = 1
+            super().setup()
+
+        def play(self, *args, **kwargs) -> None:
+            jump(self, *args, **kwargs)
+            self.update_mobjects(0)
+
+        def next_section(self, *args, **kwargs) -> None:
+            index = self.section_count
+            self.section_count += 1
+            if index == section:
+                raise _Exported
+
+    scene = ExportScene()
+    scene.setup()
+    try:
+        scene.construct()
+    except _Exported:
+        pass
+    return scene
+
+
+def displayed(scene: Scene) -> list[Mobject]:
+    """The mobjects the camera would draw, in order, minus skipped ones."""
+
+    skipped = {
+        id(member)
+        for mobject in scene.get_mobject_family_members()
+        if mobject.name in SKIPPED
+        for member in mobject.get_family()
+    }
+    return [
+        mobject
+        for mobject in scene.camera.get_mobjects_to_display(
+            list_update(scene.mobjects, scene.foreground_mobjects)
+        )
+        if id(mobject) not in skipped
+    ]
+
+
+def _stroke(
+    camera: Any, ctx: cairo.Context, vmobject: VMobject, background: bool
+) -> None:
+    width = vmobject.get_stroke_width(background)
+    rgba = vmobject.get_stroke_rgbas(background)[0]
+    if width == 0 or rgba[3] == 0:
+        return
+
+    ctx.set_source_rgba(*rgba)
+    ctx.set_line_width(width * camera.cairo_line_width_multiple)
+    # Like the camera, leave cairo's defaults for AUTO
+    if vmobject.joint_type != LineJointType.AUTO:
+        ctx.set_line_join(LINE_JOIN_MAP[vmobject.joint_type])
+    if vmobject.cap_style != CapStyleType.AUTO:
+        ctx.set_line_cap(CAP_STYLE_MAP[vmobject.cap_style])
+    ctx.stroke_preserve()
+
+
+def draw_vmobject(camera: Any, ctx: cairo.Context, vmobject: VMobject) -> None:
+    """Draws a VMobject's Bezier path the way the camera would.
+
+    Gradients are drawn in their first color.
+    """
+
+    if not len(vmobject.points):
+        return
+    camera.set_cairo_context_path(ctx, vmobject)
+
+    _stroke(camera, ctx, vmobject, background=True)
+    fill = vmobject.get_fill_rgbas()[0]
+    if fill[3] > 0:
+        ctx.set_source_rgba(*fill)
+        ctx.fill_preserve()
+    _stroke(camera, ctx, vmobject, background=False)
+    ctx.new_path()
+
+
+def draw_points(camera: Any, ctx: cairo.Context, pmobject: PMobject) -> None:
+    """Draws a point cloud as dots ``stroke_width`` pixels across."""
+
+    radius = pmobject.stroke_width / 2 * camera.frame_width / camera.pixel_width
+    for point, rgba in zip(pmobject.points, pmobject.rgbas):
+        ctx.new_sub_path()
+        ctx.arc(point[0], point[1], radius, 0, TAU)
+        ctx.set_source_rgba(*rgba)
+        ctx.fill()
+
+
+def write_vector(scene: Scene, output: Path) -> Path:
+    """Writes what's on screen as an SVG, or a PDF if ``output`` ends in .pdf."""
+
+    camera = scene.camera
+    pw, ph = camera.pixel_width, camera.pixel_height
+    fw, fh, fc = camera.frame_width, camera.frame_height, camera.frame_center
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    surface_class = cairo.PDFSurface if output.suffix == ".pdf" else cairo.SVGSurface
+    surface = surface_class(str(output), pw, ph)
+    ctx = cairo.Context(surface)
+
+    background = color_to_rgba(camera.background_color, camera.background_opacity)
+    ctx.set_source_rgba(*background)
+    ctx.paint()
+
+    # Scene units to page units, as the camera maps them to pixels
+    ctx.set_matrix(
+        cairo.Matrix(
+            pw / fw, 0, 0, -ph / fh, pw / 2 - fc[0] * pw / fw, ph / 2 + fc[1] * ph / fh
+        )
+    )
+    for mobject in displayed(scene):
+        if isinstance(mobject, VMobject):
+            draw_vmobject(camera, ctx, mobject)
+        elif isinstance(mobject, PMobject):
+            draw_points(camera, ctx, mobject)
+
+    surface.finish()
+    return output
+
+
+def export(
+    scene_file: str,
+    scene_name: str,
+    output: str | None = None,
+    section: int | None = None,
+    quality: str | None = None,
+) -> Path:
+    """Exports a scene's final diagram (or the one at the start of a section).
+
+    Skips the Compass arm and center mark. The page is the size of a frame
+    at the render quality.
+    """
+
+    configure(scene_file, quality)
+    config.write_to_movie = False
+
+    if output is None:
+        suffix = "" if section is None else f"_section{section:03d}"
+        output = Path(config.media_dir) / "exports" / f"{scene_name}{suffix}.svg"
+
+    scene = final_state(load_scene(scene_file, scene_name), section)
+    return write_vector(scene, Path(output))
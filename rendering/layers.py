@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, NamedTuple
+
+import numpy as np
+from manim import AnimationGroup, Mobject, Scene
+from manim.utils.iterables import list_update
+from numpy import ndarray
+
+# Mobject attributes that don't affect how it looks
+_IGNORED = {"submobjects", "updaters", "name"}
+
+
+def fingerprint(mobject: Mobject) -> int:
+    """A hash of everything that determines how a mobject rasterizes on its own.
+
+    Covers its points, colors and any other array or number it holds, so
+    an edit anywhere on it changes the fingerprint.
+    """
+
+    parts: list[Any] = [id(mobject)]
+    for key, value in vars(mobject).items():
+        if key in _IGNORED:
+            continue
+        if isinstance(value, ndarray):
+            parts.append((key, value.shape, value.tobytes()))
+        elif isinstance(value, (int, float, str, bool)):
+            parts.append((key, value))
+    return hash(tuple(parts))
+
+
+def camera_fingerprint(camera: Any) -> tuple:
+    """What, besides the mobjects, a rasterized layer depends on."""
+    return (
+        tuple(np.asarray(camera.frame_center, dtype=float)),
+        float(camera.frame_width),
+        float(camera.frame_height),
+        camera.pixel_array.shape,
+        id(camera.background),
+    )
+
+
+class Layer(NamedTuple):
+    """A run of static mobjects rasterized once.
+
+    The first layer of a frame is opaque and covers it all. Later ones are
+    transparent (premultiplied, as cairo draws them), cropped to their
+    drawn pixels.
+    """
+
+    pixels: ndarray
+    top: int
+    left: int
+
+
+class LayerCache:
+    """Caches raster layers of the static mobjects between frames.
+
+    The display list is split into runs of mobjects that are animating (or
+    have updaters) and runs that aren't. Static runs are rasterized once and
+    reused while their mobjects' fingerprints and the camera stay the same,
+    so a frame only rasterizes what moves and composites the rest.
+
+    A static mobject is fingerprinted once per play: between frames, only
+    its own animations and updaters change it, and those make it moving.
+    Mobjects added or removed meanwhile, and ones that move in any frame,
+    are fingerprinted again.
+    """
+
+    def __init__(self):
+        self.layers: dict[tuple, Layer] = {}
+        self.hits = 0
+        self.misses = 0
+
+        # Static mobjects' fingerprints, by id (with the mobject, in case an
+        # id gets reused)
+        self._fingerprints: dict[int, tuple[Mobject, int]] = {}
+
+    def invalidate(self) -> None:
+        """Forgets the static mobjects' fingerprints, for after editing them."""
+        self._fingerprints.clear()
+
+    def _fingerprint(self, mobject: Mobject) -> int:
+        cached = self._fingerprints.get(id(mobject))
+        if cached is not None and cached[0] is mobject:
+            return cached[1]
+        value = fingerprint(mobject)
+        self._fingerprints[id(mobject)] = (mobject, value)
+        return value
+
+    def install(self, renderer: Any) -> LayerCache:
+        """Makes a Cairo renderer draw its frames through the cache."""
+
+        def update_frame(
+            scene: Scene,
+            mobjects: Iterable[Mobject] | None = None,
+            include_submobjects: bool = True,
+            ignore_skipping: bool = True,
+            **kwargs,
+        ) -> None:
+            if renderer.skip_animations and not ignore_skipping:
+                return
+            self.update_frame(renderer.camera, scene)
+
+        def save_static_frame_data(
+            scene: Scene, static_mobjects: Iterable[Mobject]
+        ) -> None:
+            # The layers replace manim's one static image per play, and the
+            # scene may have been edited since the last one
+            renderer.static_image = None
+            self.invalidate()
+
+        renderer.update_frame = update_frame
+        renderer.save_static_frame_data = save_static_frame_data
+        return self
+
+    def _moving(self, scene: Scene) -> set[int]:
+        """Mobjects that may change this frame: animated or updated ones."""
+
+        def animated(animations: Iterable[Any]) -> Iterable[Mobject]:
+            for animation in animations:
+                yield from animation.mobject.get_family()
+                if isinstance(animation, AnimationGroup):
+                    yield from animated(animation.animations)
+
+        moving = {id(mobject) for mobject in animated(scene.animations or [])}
+        for mobject in scene.get_mobject_family_members():
+            if mobject.updaters and not mobject.updating_suspended:
+                moving.update(id(member) for member in mobject.get_family())
+        return moving
+
+    def update_frame(self, camera: Any, scene: Scene) -> None:
+        display = camera.get_mobjects_to_display(
+            list_update(scene.mobjects, scene.foreground_mobjects)
+        )
+        moving = self._moving(scene)
+        for key in moving:
+            self._fingerprints.pop(key, None)
+
+        # Split the display order into alternating static and moving runs
+        runs: list[tuple[bool, list[Mobject]]] = []
+        for mobject in display:
+            static = id(mobject) not in moving
+            if runs and runs[-1][0] == static:
+                runs[-1][1].append(mobject)
+            else:
+                runs.append((static, [mobject]))
+
+        view = camera_fingerprint(camera)
+        layers: dict[int, Layer] = {}
+        used: dict[tuple, Layer] = {}
+
+        for i, (static, run) in enumerate(runs):
+            if not static:
+                continue
+            key = (view, i == 0, tuple(self._fingerprint(mobject) for mobject in run))
+            layer = self.layers.get(key)
+            if layer is None:
+                self.misses += 1
+                layer = self._rasterize(camera, run, opaque=i == 0)
+            else:
+                self.hits += 1
+            layers[i] = used[key] = layer
+
+        # Layers nothing used this frame are stale
+        self.layers = used
+
+        if 0 in layers:
+            camera.pixel_array[:] = layers[0].pixels
+        else:
+            camera.reset()
+
+        for i, (static, run) in enumerate(runs):
+            if i == 0 and static:
+                continue
+            if static:
+                self._composite(camera.pixel_array, layers[i])
+            else:
+                camera.capture_mobjects(run, include_submobjects=False)
+
+    def _rasterize(self, camera: Any, run: list[Mobject], opaque: bool) -> Layer:
+        if opaque:
+            camera.reset()
+        else:
+            camera.pixel_array[:] = 0
+        camera.capture_mobjects(run, include_submobjects=False)
+
+        pixels = camera.pixel_array.copy()
+        if opaque:
+            return Layer(pixels, 0, 0)
+
+        # Keep only the part anything was drawn on
+        rows, columns = np.nonzero(pixels[..., 3])
+        if not len(rows):
+            return Layer(pixels[:0, :0], 0, 0)
+        top, left = rows.min(), columns.min()
+        bottom, right = rows.max() + 1, columns.max() + 1
+        return Layer(pixels[top:bottom, left:right].copy(), int(top), int(left))
+
+    @staticmethod
+    def _composite(frame: ndarray, layer: Layer) -> None:
+        """Draws a premultiplied layer over the frame."""
+
+        height, width = layer.pixels.shape[:2]
+        if not height:
+            return
+
+        region = frame[layer.top : layer.top + height, layer.left : layer.left + width]
+        alpha = layer.pixels[..., 3:4].astype(np.uint16)
+        region[:] = layer.pixels + (region * (255 - alpha) + 127) // 255
+
+
+def layer_cached(scene_class: type[Scene]) -> type[Scene]:
+    """A subclass of the scene that renders through a ``LayerCache``."""
+
+    class LayerCachedScene(scene_class):
+        def setup(self):
+            self.layer_cache = LayerCache().install(self.renderer)
+            super().setup()
+
+        def add(self, *mobjects: Mobject) -> Scene:
+            self.layer_cache.invalidate()
+            return super().add(*mobjects)
+
+        def remove(self, *mobjects: Mobject) -> Scene:
+            self.layer_cache.invalidate()
+            return super().remove(*mobjects)
+
+    LayerCachedScene.__name__ = scene_class.__name__
+    LayerCachedScene.__qualname__ = scene_class.__qualname__
+    return LayerCachedScene
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import functools
+import json
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from manim import Mobject, Scene
+
+
+def updater_name(function: Callable) -> str:
+    """A readable name for an updater.
+
+    ``always_redraw`` hides the real work in a lambda around the function it
+    was given, so that function's name is included.
+    """
+
+    name = getattr(function, "__qualname__", None) or repr(function)
+    if "<lambda>" in name:
+        for cell in getattr(function, "__closure__", None) or ():
+            try:
+                inner = cell.cell_contents
+            except ValueError:
+                continue
+            if callable(inner) and not isinstance(inner, (Mobject, type)):
+                return f"{name}({getattr(inner, '__qualname__', repr(inner))})"
+    return name
+
+
+class UpdaterProfiler:
+    """Times every updater added to a mobject or a scene.
+
+    Records, per updater, the calls and time spent in it overall, in each
+    frame and in each ``play``, along with how many mobjects each play
+    allocated.
+    """
+
+    def __init__(self):
+        self.totals: defaultdict[str, dict[str, float]] = defaultdict(
+            lambda: {"calls": 0, "total_s": 0.0, "max_call_s": 0.0, "max_frame_s": 0.0}
+        )
+        self.plays: list[dict[str, Any]] = []
+        self._frame: defaultdict[str, float] = defaultdict(float)
+        self._wrappers: dict[Callable, Callable] = {}
+        self._patched: list[tuple[type, str, Callable]] = []
+
+        self._new_play()
+
+    def _new_play(self) -> None:
+        self.plays.append(
+            {
+                "frames": 0,
+                "allocated_mobjects": 0,
+                "updaters": defaultdict(lambda: {"calls": 0, "total_s": 0.0}),
+            }
+        )
+
+    def _end_frame(self) -> None:
+        for name, seconds in self._frame.items():
+            stats = self.totals[name]
+            stats["max_frame_s"] = max(stats["max_frame_s"], seconds)
+        self._frame.clear()
+
+    def wrap(self, function: Callable) -> Callable:
+        """The timed version of an updater (the same one every time)."""
+
+        if function in self._wrappers:
+            return self._wrappers[function]
+
+        name = updater_name(function)
+
+        # wraps() keeps the signature, which manim checks for a dt parameter
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+
+                stats = self.totals[name]
+                stats["calls"] += 1
+                stats["total_s"] += elapsed
+                stats["max_call_s"] = max(stats["max_call_s"], elapsed)
+
+                play = self.plays[-1]["updaters"][name]
+                play["calls"] += 1
+                play["total_s"] += elapsed
+
+                self._frame[name] += elapsed
+
+        self._wrappers[function] = timed
+        return timed
+
+    def _patch(self, cls: type, attribute: str, replacement: Callable) -> None:
+        original = getattr(cls, attribute)
+        self._patched.append((cls, attribute, original))
+        setattr(cls, attribute, replacement(original))
+
+    def install(self) -> None:
+        profiler = self
+
+        def add_updater(original):
+            def patched(self, update_function, *args, **kwargs):
+                return original(self, profiler.wrap(update_function), *args, **kwargs)
+
+            return patched
+
+        def remove_updater(original):
+            def patched(self, update_function, *args, **kwargs):
+                update_function = profiler._wrappers.get(update_function, update_function)
+                return original(self, update_function, *args, **kwargs)
+
+            return patched
+
+        def counting(original):
+            def patched(self, *args, **kwargs):
+                profiler.plays[-1]["allocated_mobjects"] += 1
+                return original(self, *args, **kwargs)
+
+            return patched
+
+        def frame(original):
+            def patched(self, *args, **kwargs):
+                profiler._end_frame()
+                profiler.plays[-1]["frames"] += 1
+                return original(self, *args, **kwargs)
+
+            return patched
+
+        def play(original):
+            def patched(self, *args, **kwargs):
+                try:
+                    return original(self, *args, **kwargs)
+                finally:
+                    profiler._end_frame()
+                    profiler._new_play()
+
+            return patched
+
+        for cls in (Mobject, Scene):
+            self._patch(cls, "add_updater", add_updater)
+            self._patch(cls, "remove_updater", remove_updater)
+        self._patch(Mobject, "__init__", counting)
+        self._patch(Mobject, "copy", counting)
+        self._patch(Scene, "update_to_time", frame)
+        self._patch(Scene, "play", play)
+
+    def uninstall(self) -> None:
+        for cls, attribute, original in reversed(self._patched):
+            setattr(cls, attribute, original)
+        self._patched.clear()
+
+    def report(self) -> dict[str, Any]:
+        """Everything recorded, ready to be written as JSON."""
+
+        self._end_frame()
+        return {
+            "updaters": dict(
+                sorted(self.totals.items(), key=lambda item: -item[1]["total_s"])
+            ),
+            "plays": [
+                {**play, "updaters": dict(play["updaters"])}
+                for play in self.plays
+                if play["frames"] or play["updaters"] or play["allocated_mobjects"]
+            ],
+        }
+
+    def folded(self) -> str:
+        """The per-play updater times in folded-stack format.
+
+        Feed this to ``flamegraph.pl`` or speedscope; weights are microseconds.
+        """
+
+        lines = []
+        for index, play in enumerate(self.plays):
+            for name, stats in play["updaters"].items():
+                micros = round(stats["total_s"] * 1e6)
+                if micros:
+                    lines.append(f"play {index:03d};{name.replace(';', ',')} {micros}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str | Path) -> None:
+        """Writes the JSON report to ``path`` and the folded stacks next to it."""
+        path = Path(path)
+        path.write_text(json.dumps(self.report(), indent=2) + "\n")
+        path.with_suffix(".folded").write_text(self.folded())
+
+
+@contextmanager
+def profile_updaters(path: str | Path | None = None) -> Iterator[UpdaterProfiler]:
+    """Profiles every updater added inside the ``with`` block.
+
+    With a ``path``, the report is written there when the block exits.
+    """
+
+    profiler = UpdaterProfiler()
+    profiler.install()
+    try:
+        yield profiler
+    finally:
+        profiler.uninstall()
+        if path is not None:
+            profiler.write(path)
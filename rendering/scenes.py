@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+from manim import Scene, config
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def load_module(scene_file: str | Path) -> ModuleType:
+    """Imports a scene file, the way manim's CLI does."""
+
+    path = Path(scene_file).resolve()
+
+    # Scenes import their neighbours by name (e.g. perp_bis.py imports compass)
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[path.stem] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_scene(scene_file: str | Path, scene_name: str) -> type[Scene]:
+    """Imports a scene class from its file."""
+    return getattr(load_module(scene_file), scene_name)
+
+
+def load_scenes(scene_file: str | Path) -> list[type[Scene]]:
+    """Every scene class defined in a file (not just imported into it)."""
+
+    module = load_module(scene_file)
+    return [
+        value
+        for value in vars(module).values()
+        if isinstance(value, type)
+        and issubclass(value, Scene)
+        and value.__module__ == module.__name__
+    ]
+
+
+def configure(scene_file: str | Path, quality: str | None = None) -> None:
+    """Renders into the scene's own media folder, like running manim beside it."""
+    config.media_dir = str(Path(scene_file).resolve().parent / "media")
+    if quality is not None:
+        config.quality = QUALITIES[quality]
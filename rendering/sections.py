@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+import tempfile
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+from manim import DefaultSectionType, Scene, config, logger
+
+from rendering.layers import layer_cached
+from rendering.scenes import configure, load_scene
+
+
+def sectioned(
+    scene_class: type[Scene], rendered: int | None, onwards: bool = False
+) -> type[Scene]:
+    """A subclass of the scene that only renders one of its sections.
+
+    Sections are delimited by ``self.next_section(...)`` calls in
+    ``construct``; the part before the first call is section 0. All other
+    sections still run, with their animations skipped, so the rendered
+    section starts from exactly the state it would in a full render.
+    ``rendered=None`` skips every section, which is enough to count them.
+    With ``onwards``, every section from ``rendered`` on is rendered.
+    """
+
+    def skipped(index: int) -> bool:
+        if rendered is None:
+            return True
+        return index < rendered if onwards else index != rendered
+
+    class SectionedScene(scene_class):
+        def setup(self):
+            self.section_count = 1
+            super().setup()
+            super().next_section("start", skip_animations=skipped(0))
+
+        def next_section(
+            self,
+            name: str = "unnamed",
+            section_type: str = DefaultSectionType.NORMAL,
+            skip_animations: bool = False,
+        ) -> None:
+            index = self.section_count
+            self.section_count += 1
+            super().next_section(name, section_type, skip_animations or skipped(index))
+
+    SectionedScene.__name__ = scene_class.__name__
+    SectionedScene.__qualname__ = scene_class.__qualname__
+    return SectionedScene
+
+
+def count_sections(scene_file: str, scene_name: str) -> int:
+    """Runs the scene with every animation skipped to count its sections.
+
+    Its Tex is recorded meanwhile and compiled in one batch, so workers
+    find it all cached instead of each compiling it again.
+    """
+
+    # tex imports this module
+    from rendering.tex import compile_batch, recording_tex
+
+    configure(scene_file)
+    config.write_to_movie = False
+
+    with recording_tex() as requests:
+        scene = sectioned(load_scene(scene_file, scene_name), None)()
+        scene.render()
+    compile_batch(requests)
+    return scene.section_count
+
+
+def render_section(
+    scene_file: str, scene_name: str, index: int, quality: str | None, layers: bool = False
+) -> str | None:
+    """Renders one section in this process, returning its movie file."""
+
+    configure(scene_file, quality)
+    config.output_file = f"{scene_name}_section{index:03d}"
+
+    # Workers write (and clean up) partial movies in separate folders
+    config.partial_movie_dir = (
+        f"{{video_dir}}/partial_movie_files/{{scene_name}}/section{index:03d}"
+    )
+
+    scene_class = sectioned(load_scene(scene_file, scene_name), index)
+    scene = (layer_cached(scene_class) if layers else scene_class)()
+    scene.render()
+
+    movie = Path(scene.renderer.file_writer.movie_file_path)
+    return str(movie) if movie.exists() else None
+
+
+def render_from(
+    scene_file: str,
+    scene_name: str,
+    section: int,
+    quality: str | None = None,
+    layers: bool = False,
+    pipeline_tex: bool = False,
+    scan_tex: bool = False,
+) -> str | None:
+    """Renders a scene from a section to its end, returning the movie file.
+
+    Earlier sections run with their animations skipped, as with manim's
+    ``-n``. ``pipeline_tex`` compiles the scene's Tex in the background while
+    it renders, finding it by scanning the source if ``scan_tex``.
+    """
+
+    # tex imports this module
+    from rendering.tex import pipelined_tex
+
+    configure(scene_file, quality)
+    config.output_file = f"{scene_name}_from{section:03d}"
+
+    template = load_scene(scene_file, scene_name)
+    scene_class = sectioned(template, section, onwards=True)
+    pipeline = pipelined_tex(scene_file, template, scan_tex)
+    with pipeline if pipeline_tex else nullcontext():
+        scene = (layer_cached(scene_class) if layers else scene_class)()
+        scene.render()
+
+    movie = Path(scene.renderer.file_writer.movie_file_path)
+    return str(movie) if movie.exists() else None
+
+
+def concatenate(movies: list[str], output: Path) -> None:
+    """Joins movies end to end without re-encoding them."""
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        for movie in movies:
+            listing.write(f"file '{Path(movie).as_posix()}'\n")
+
+    try:
+        subprocess.run(
+            [
+                shutil.which("ffmpeg") or "ffmpeg",
+                "-y",
+                "-loglevel", "error",
+                "-f", "concat",
+                "-safe", "0",
+                "-i", listing.name,
+                "-c", "copy",
+                str(output),
+            ],
+            check=True,
+        )
+    finally:
+        Path(listing.name).unlink()
+
+
+def render_parallel(
+    scene_file: str,
+    scene_name: str,
+    workers: int | None = None,
+    quality: str | None = None,
+    layers: bool = False,
+) -> Path | None:
+    """Renders each section of a scene in its own process and joins them in order."""
+
+    sections = count_sections(scene_file, scene_name)
+    logger.info("Rendering %d sections of %s", sections, scene_name)
+
+    # Spawn, so every worker imports manim and the scene fresh
+    with ProcessPoolExecutor(workers, mp_context=get_context("spawn")) as pool:
+        movies = list(
+            pool.map(
+                render_section,
+                [scene_file] * sections,
+                [scene_name] * sections,
+                range(sections),
+                [quality] * sections,
+                [layers] * sections,
+            )
+        )
+
+    movies = [movie for movie in movies if movie is not None]
+    if not movies:
+        return None
+
+    output = Path(movies[0]).with_name(f"{scene_name}{Path(movies[0]).suffix}")
+    concatenate(movies, output)
+    return output
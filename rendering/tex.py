@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import ast
+import os
+import subprocess
+import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+import manim
+from manim import Scene, config, logger, tempconfig
+from manim.mobject.text import tex_mobject
+from manim.utils.tex import TexTemplate
+from manim.utils.tex_file_writing import (
+    generate_tex_file,
+    make_tex_compilation_command,
+    tex_to_svg_file,
+)
+
+from rendering.scenes import load_scenes
+from rendering.sections import sectioned
+
+TEX_CLASSES = ("Tex", "MathTex", "SingleStringMathTex")
+
+_PLACEHOLDER_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="1" height="1">'
+    '<path d="M0 0h1v1h-1z"/></svg>'
+)
+
+
+class TexRequest(NamedTuple):
+    """One expression manim would compile, exactly as it would compile it."""
+
+    expression: str
+    environment: str | None
+    tex_template: TexTemplate
+
+    @property
+    def tex_file(self) -> Path:
+        """The cache entry's .tex file (written if missing)."""
+        return generate_tex_file(self.expression, self.environment, self.tex_template)
+
+    @property
+    def svg_file(self) -> Path:
+        return self.tex_file.with_suffix(".svg")
+
+
+@contextmanager
+def recording_tex() -> Iterator[list[TexRequest]]:
+    """Records the expressions Tex mobjects ask for instead of compiling them.
+
+    The mobjects built meanwhile get a placeholder glyph and are useless
+    beyond telling us what to compile.
+    """
+
+    requests: list[TexRequest] = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        placeholder = Path(tmp) / "placeholder.svg"
+        placeholder.write_text(_PLACEHOLDER_SVG)
+
+        def record(expression, environment=None, tex_template=None):
+            requests.append(
+                TexRequest(expression, environment, tex_template or config["tex_template"])
+            )
+            return placeholder
+
+        tex_mobject.tex_to_svg_file = record
+        try:
+            yield requests
+        finally:
+            tex_mobject.tex_to_svg_file = tex_to_svg_file
+
+
+def collect_tex(scene_file: str | Path) -> list[TexRequest]:
+    """Finds the Tex a scene file builds by scanning its source.
+
+    Every ``Tex(...)``/``MathTex(...)`` call whose arguments can be evaluated
+    on their own (literals and manim names like ``BLUE_C``) is built once with
+    compilation recorded. Calls that depend on the scene's variables are
+    skipped and compiled by manim as usual.
+    """
+
+    scene_file = Path(scene_file)
+    tree = ast.parse(scene_file.read_text(encoding="utf-8"), str(scene_file))
+    namespace = vars(manim)
+
+    calls = [
+        node
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in TEX_CLASSES
+    ]
+    calls.sort(key=lambda node: (node.lineno, node.col_offset))
+
+    with recording_tex() as requests:
+        for call in calls:
+            try:
+                eval(compile(ast.Expression(call), str(scene_file), "eval"), namespace)
+            except Exception:  # noqa: BLE001 - anything unevaluable is left to manim
+                continue
+
+    return requests
+
+
+def record_scene_tex(scene_class: type[Scene]) -> list[TexRequest]:
+    """Finds the Tex a scene builds by running it with every animation skipped.
+
+    Slower than ``collect_tex``, but it also sees Tex built from the scene's
+    own variables, as in scenes rendered from a template.
+    """
+
+    with tempconfig({"write_to_movie": False}), recording_tex() as requests:
+        sectioned(scene_class, None)().render()
+    return requests
+
+
+@contextmanager
+def pipelined_tex(
+    scene_file: str | Path,
+    scene_class: type[Scene] | None = None,
+    scan: bool = False,
+    workers: int | None = None,
+) -> Iterator[dict[Path, Future]]:
+    """Compiles a scene's Tex in background threads while the scene renders.
+
+    The Tex ``scene_class`` builds is recorded up front (as ``find_tex``
+    does, or found by scanning ``scene_file`` with ``scan``) and starts
+    compiling in the order it's built. A ``Tex`` built meanwhile only waits
+    for its own expression, so LaTeX runs alongside the rendering of
+    everything before it. Tex that wasn't found is compiled as usual.
+
+    On exit, compilations not yet started are dropped and running ones are
+    waited for, and the time spent waiting on them is logged against the
+    time spent compiling. Yields the compilations by SVG file.
+    """
+
+    if scan or scene_class is None:
+        requests = collect_tex(scene_file)
+    else:
+        requests = record_scene_tex(scene_class)
+
+    pending: dict[Path, Future] = {}
+    compiling: list[float] = []  # appended to from the pool's threads
+    waiting = 0.0
+
+    def compile_request(request: TexRequest) -> Path:
+        start = time.perf_counter()
+        try:
+            return tex_to_svg_file(
+                request.expression, request.environment, request.tex_template
+            )
+        finally:
+            compiling.append(time.perf_counter() - start)
+
+    def wait_or_compile(expression, environment=None, tex_template=None):
+        nonlocal waiting
+        request = TexRequest(expression, environment, tex_template or config["tex_template"])
+        future = pending.get(request.svg_file)
+        if future is None:
+            return tex_to_svg_file(expression, environment, tex_template)
+
+        start = time.perf_counter()
+        try:
+            return future.result()
+        finally:
+            waiting += time.perf_counter() - start
+
+    pool = ThreadPoolExecutor(workers)
+    for request in requests:
+        if request.svg_file not in pending and not request.svg_file.exists():
+            pending[request.svg_file] = pool.submit(compile_request, request)
+    logger.info("Compiling %d Tex expressions in the background", len(pending))
+
+    tex_mobject.tex_to_svg_file = wait_or_compile
+    try:
+        yield pending
+    finally:
+        # Nothing may still be writing into the Tex cache once we're done
+        pool.shutdown(wait=True, cancel_futures=True)
+        tex_mobject.tex_to_svg_file = tex_to_svg_file
+        logger.info(
+            "Waited %.2fs for %.2fs of background Tex compilation",
+            waiting,
+            sum(compiling),
+        )
+
+
+def _page_code(request: TexRequest) -> str:
+    """What the request puts in place of its template's placeholder."""
+
+    template = request.tex_template
+    if request.environment is not None:
+        code = template.get_texcode_for_expression_in_env(request.expression, request.environment)
+    else:
+        code = template.get_texcode_for_expression(request.expression)
+
+    prefix, _, suffix = template.body.partition(template.placeholder_text)
+    return code[len(prefix) : len(code) - len(suffix)]
+
+
+def _batch_document(requests: list[TexRequest]) -> str | None:
+    """One document typesetting every request on its own page.
+
+    Only ``standalone`` templates can be split into pages like this.
+    """
+
+    template = requests[0].tex_template
+    documentclass = template.documentclass
+    if not documentclass.endswith("{standalone}"):
+        return None
+
+    # Every standalone environment becomes its own cropped page
+    if "[" in documentclass:
+        multi = documentclass.replace("]", ",multi]", 1)
+    else:
+        multi = documentclass.replace(r"\documentclass", r"\documentclass[multi]", 1)
+
+    pages = "\n".join(
+        "\\begin{standalone}\n" + _page_code(request) + "\n\\end{standalone}"
+        for request in requests
+    )
+    body = template.body.replace(documentclass, multi, 1)
+    return body.replace(template.placeholder_text, pages)
+
+
+def _compile_pages(requests: list[TexRequest], document: str) -> None:
+    """Compiles a batch document once and files each page under its request."""
+
+    template = requests[0].tex_template
+    compilers = template.tex_compiler
+    compilers = [compilers] if isinstance(compilers, str) else compilers
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tex_file = Path(tmp) / "batch.tex"
+        tex_file.write_text(document, encoding="utf-8")
+
+        for compiler in compilers:
+            command = make_tex_compilation_command(
+                compiler, template.output_format, tex_file, Path(tmp)
+            )
+            if subprocess.run(command, stdout=subprocess.DEVNULL).returncode != 0:
+                raise ValueError(f"{compiler} error compiling {tex_file} in a batch")
+
+        subprocess.run(
+            [
+                "dvisvgm",
+                *(["--pdf"] if template.output_format == ".pdf" else []),
+                "--page=1-",
+                "--no-fonts",
+                "--verbosity=0",
+                f"--output={Path(tmp).as_posix()}/page-%p.svg",
+                tex_file.with_suffix(template.output_format).as_posix(),
+            ],
+            stdout=subprocess.DEVNULL,
+        )
+
+        pages = sorted(Path(tmp).glob("page-*.svg"), key=lambda page: int(page.stem[5:]))
+        if len(pages) != len(requests):
+            raise ValueError(
+                f"Batch produced {len(pages)} pages for {len(requests)} expressions"
+            )
+
+        # Moving whole files in keeps the cache valid even if we're interrupted
+        for page, request in zip(pages, requests):
+            os.replace(page, request.svg_file)
+
+
+def compile_batch(requests: list[TexRequest]) -> int:
+    """Compiles every uncached request, one LaTeX run per template.
+
+    Results land in manim's Tex cache exactly where ``Tex`` looks for them.
+    Returns the number of expressions compiled.
+    """
+
+    # Duplicates share a cache entry
+    pending: dict[Path, TexRequest] = {}
+    for request in requests:
+        if not request.svg_file.exists():
+            pending.setdefault(request.svg_file, request)
+
+    batches: dict[tuple, list[TexRequest]] = {}
+    for request in pending.values():
+        template = request.tex_template
+        key = (template.body, str(template.tex_compiler), template.output_format)
+        batches.setdefault(key, []).append(request)
+
+    for batch in batches.values():
+        document = _batch_document(batch)
+        if document is None:
+            for request in batch:
+                tex_to_svg_file(request.expression, request.environment, request.tex_template)
+            continue
+
+        logger.info("Compiling %d Tex expressions in one batch", len(batch))
+        try:
+            _compile_pages(batch, document)
+        except ValueError:
+            # Let manim compile them one by one and report the broken one
+            for request in batch:
+                tex_to_svg_file(request.expression, request.environment, request.tex_template)
+
+    return len(pending)
+
+
+def find_tex(scene_file: str | Path, scan: bool = False) -> list[TexRequest]:
+    """The Tex every scene in a file builds, found by running the scenes.
+
+    ``scan`` only scans the source with ``collect_tex``, which is quicker but
+    misses Tex built from variables, like a ``Proof``'s steps or a template
+    scene's problem.
+    """
+
+    if scan:
+        return collect_tex(scene_file)
+    return [
+        request
+        for scene_class in load_scenes(scene_file)
+        for request in record_scene_tex(scene_class)
+    ]
+
+
+def prewarm(*scene_files: str | Path, scan: bool = False) -> int:
+    """Compiles all the Tex found in scene files into the Tex cache."""
+    return compile_batch(
+        [request for path in scene_files for request in find_tex(path, scan)]
+    )
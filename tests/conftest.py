@@ -0,0 +1,9 @@
+import sys
+from pathlib import Path
+
+# Modules import their neighbours by name, as they do when rendered from
+# their own folder
+ROOT = Path(__file__).resolve().parent.parent
+for folder in (ROOT, ROOT / "geo" / "compass", ROOT / "alg"):
+    if str(folder) not in sys.path:
+        sys.path.insert(0, str(folder))
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from construction import Construction
+from core import CompassState, arc_intersection
+
+
+def circle_arc(construction, x, y, radius):
+    """A full-circle arc read from a circle of ``construction``."""
+    circle = construction.circle(construction.point(x, y), radius)
+    return CompassState(x, y, radius, 0).arcs([(0, 2 * np.pi)], circle)[0]
+
+
+def test_arcs_of_one_construction_share_intersection_nodes():
+    construction = Construction()
+    a = circle_arc(construction, -2, 0, 2.5)
+    b = circle_arc(construction, 2, 0, 2.5)
+
+    points = arc_intersection(None, a, b)
+    assert sorted(points) == [(0.0, -1.5), (0.0, 1.5)]
+    assert construction.intersections(a.construction_node, b.construction_node)
+
+
+def test_arcs_of_two_compasses_constructions():
+    # Each compass without a shared construction numbers its nodes from 0
+    first, second, third = Construction(), Construction(), Construction()
+    a = circle_arc(first, -2, 0, 2.5)
+    b = circle_arc(second, 2, 0, 2.5)
+    c = circle_arc(third, 20, 0, 1)
+
+    assert sorted(arc_intersection(None, a, b)) == [(0.0, -1.5), (0.0, 1.5)]
+    assert arc_intersection(None, a, c) is None
+
+
+def test_intersections_rejects_other_constructions_nodes():
+    first, second = Construction(), Construction()
+    a = first.circle(first.point(0, 0), 1)
+    b = second.circle(second.point(1, 0), 1)
+
+    with pytest.raises(ValueError):
+        first.intersections(a, b)
+
+
+# Where circles of radius 2.5 around (-2, 0) and (2, 0) cross, as seen from
+# (-2, 0): (0, 1.5) above and (0, -1.5) below
+UPPER = np.arctan2(1.5, 2)
+TAU = 2 * np.pi
+
+
+def left_and_right(shared, segment):
+    """The ``segment`` of the left circle, and the whole right one, with both
+    in one construction if ``shared`` and in none otherwise."""
+    if shared:
+        construction = Construction()
+        left = construction.circle(construction.point(-2, 0), 2.5)
+        right = construction.circle(construction.point(2, 0), 2.5)
+    else:
+        left = right = None
+    return (
+        CompassState(-2, 0, 2.5, 0).arcs([segment], left)[0],
+        CompassState(2, 0, 2.5, 0).arcs([(0, TAU)], right)[0],
+    )
+
+
+@pytest.mark.parametrize("shared", [True, False], ids=["nodes", "fallback"])
+@pytest.mark.parametrize(
+    "segment, expected",
+    [
+        ((0, 1), [(0.0, 1.5)]),
+        ((0, -1), [(0.0, -1.5)]),  # clockwise
+        ((-1, 1), [(0.0, -1.5), (0.0, 1.5)]),
+        ((1.5 * np.pi, 2.5 * np.pi), [(0.0, -1.5), (0.0, 1.5)]),  # wraps past 2 pi
+        ((2.5 * np.pi, 1.5 * np.pi), [(0.0, -1.5), (0.0, 1.5)]),
+        ((TAU - 1, TAU + 1), [(0.0, -1.5), (0.0, 1.5)]),
+        ((UPPER, 1), [(0.0, 1.5)]),  # from exactly one point
+        ((-UPPER, UPPER), [(0.0, -1.5), (0.0, 1.5)]),  # exactly between them
+        ((UPPER + 1e-6, 1), None),
+        ((1, 5), None),
+    ],
+)
+def test_arc_intersection_within_arcs(shared, segment, expected):
+    a, b = left_and_right(shared, segment)
+    points = arc_intersection(None, a, b, within_arcs=True)
+    if expected is None:
+        assert points is None
+    else:
+        np.testing.assert_allclose(sorted(points), expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("shared", [True, False], ids=["nodes", "fallback"])
+def test_arc_intersection_as_circles(shared):
+    a, b = left_and_right(shared, (1, 5))
+    points = arc_intersection(None, a, b, within_arcs=False)
+    np.testing.assert_allclose(sorted(points), [(0, -1.5), (0, 1.5)], atol=1e-12)
+    if shared:
+        assert a.construction_node.construction.intersections(
+            a.construction_node, b.construction_node
+        )
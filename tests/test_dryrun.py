@@ -0,0 +1,62 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import LEFT, RIGHT, TAU  # noqa: E402
+
+from compass import Compass, arc_intersection  # noqa: E402
+from dryrun import DryRun  # noqa: E402
+
+
+def test_compass_timeline_dry_run():
+    run = DryRun()
+    compass = Compass(run, radius=2.5)
+
+    with compass.timeline():
+        compass.move_to(LEFT * 2)
+        arcs = compass.draw_segments((0.05 * TAU, 0.15 * TAU), (0.85 * TAU, 0.95 * TAU))
+        compass.set_radius(1.5)
+        compass.move_to(RIGHT * 2)
+
+    assert run.plays == 2  # the FadeIn, then the whole timeline
+    assert (compass.x, compass.y, compass.radius) == (2, 0, 1.5)
+    assert len(arcs) == 2
+    assert all(arc in run.arcs for arc in arcs)
+    assert compass.arm in run.mobjects
+
+
+def test_arcs_of_two_compasses_intersect():
+    run = DryRun()
+    left = Compass(run, center=(-2, 0), radius=2.5)
+    right = Compass(run, center=(2, 0), radius=2.5)
+    far = Compass(run, center=(20, 0), radius=1)
+
+    a = left.draw_segments((0, TAU))[0]
+    b = right.draw_segments((0, TAU))[0]
+    c = far.draw_segments((0, TAU))[0]
+
+    assert sorted(arc_intersection(run, a, b)) == [(0.0, -1.5), (0.0, 1.5)]
+    assert arc_intersection(run, a, c) is None
+
+
+def test_move_to_snaps_to_nearest_point_within_tolerance():
+    run = DryRun()
+    left = Compass(run, center=(-2, 0), radius=2.5)
+    right = Compass(run, center=(2, 0), radius=2.5)
+    a = left.draw_segments((0, TAU))[0]
+    b = right.draw_segments((0, TAU))[0]
+    arc_intersection(run, a, b)  # indexes (0, 1.5) and (0, -1.5)
+
+    compass = Compass(run, radius=1)
+    compass.move_to((0.1, 1.3), snap=0.5)
+    assert (compass.x, compass.y) == pytest.approx((0, 1.5))
+
+    # Both are in reach; the nearer one wins
+    compass.move_to((0.2, -0.5), snap=3)
+    assert (compass.x, compass.y) == pytest.approx((0, -1.5))
+
+    # Out of reach, the position is left alone
+    compass.move_to((0.5, 0.5), snap=0.5)
+    assert (compass.x, compass.y) == (0.5, 0.5)
+    compass.move_to((0.1, 1.3))
+    assert (compass.x, compass.y) == (0.1, 1.3)
@@ -0,0 +1,42 @@
+import pytest
+
+pytest.importorskip("manim")
+pytest.importorskip("cairo")
+
+from manim import LEFT, RIGHT, UP, Create, Line, Scene, tempconfig  # noqa: E402
+
+from rendering.export import final_state, write_vector  # noqa: E402
+
+
+class DefaultLine(Scene):
+    def construct(self):
+        self.play(Create(Line(LEFT, RIGHT)))
+
+
+class TwoSections(Scene):
+    def construct(self):
+        self.first = Line(LEFT, RIGHT)
+        self.play(Create(self.first))
+        self.next_section("Shift")
+        self.play(self.first.animate.shift(UP))
+
+
+@pytest.mark.parametrize("suffix", [".svg", ".pdf"])
+def test_export_default_styled_line(tmp_path, suffix):
+    with tempconfig({"write_to_movie": False, "media_dir": str(tmp_path)}):
+        scene = final_state(DefaultLine)
+        output = write_vector(scene, tmp_path / f"line{suffix}")
+
+    assert output.stat().st_size > 0
+    if suffix == ".svg":
+        assert "<path" in output.read_text()
+
+
+def test_final_state_stops_at_section():
+    with tempconfig({"write_to_movie": False}):
+        start = final_state(TwoSections, section=1)
+        end = final_state(TwoSections)
+
+    assert start.first in start.mobjects
+    assert start.first.get_center()[1] == 0
+    assert end.first.get_center()[1] == 1
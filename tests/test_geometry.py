@@ -0,0 +1,328 @@
+from math import hypot, sqrt
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from core import CompassState, screen_tolerance
+from geometry import (
+    EPSILON,
+    ArcGeometry,
+    arc_components,
+    arc_intersections,
+    circle_intersections,
+    circle_points,
+    in_arc_extent,
+    intersect_circles,
+    intersect_line_circle,
+)
+
+
+def reference(c0, r0, c1, r1, eps=EPSILON):
+    """One pair of circles, one case at a time: ``(case, points)``."""
+
+    dx, dy = c1[0] - c0[0], c1[1] - c0[1]
+    d = hypot(dx, dy)
+    if d <= eps and abs(r0 - r1) <= eps:
+        return "coincident", []
+    if d > r0 + r1 + eps:
+        return "disjoint", []
+    if d < abs(r0 - r1) - eps:
+        return "contained", []
+
+    a = (r0 * r0 - r1 * r1 + d * d) / (2 * d)
+    ux, uy = dx / d, dy / d
+    mx, my = c0[0] + a * ux, c0[1] + a * uy
+    if abs(d - (r0 + r1)) <= eps or abs(d - abs(r0 - r1)) <= eps:
+        return "tangent", [(mx, my)]
+
+    h = sqrt(max(r0 * r0 - a * a, 0))
+    return "intersecting", [(mx + h * uy, my - h * ux), (mx - h * uy, my + h * ux)]
+
+
+def case(result, i=0, j=0):
+    for name in ("coincident", "disjoint", "contained", "tangent"):
+        if getattr(result, name)[i, j]:
+            return name
+    return "intersecting"
+
+
+def found(result, i=0, j=0):
+    """The valid points of pair ``i, j``, as a ``(K, 2)`` array."""
+    return result.points[i, j][result.valid[i, j]].reshape(-1, 2)
+
+
+@pytest.mark.parametrize(
+    "c0, r0, c1, r1, expected",
+    [
+        ((0, 0), 1, (1, 0), 1, "intersecting"),
+        ((0, 0), 1, (2, 0), 1, "tangent"),  # outside each other
+        ((0, 0), 2, (1, 0), 1, "tangent"),  # one inside the other
+        ((1, 1), 1.5, (1, 1), 1.5, "coincident"),
+        ((0, 0), 3, (0.5, 0), 1, "contained"),
+        ((0, 0), 3, (0, 0), 1, "contained"),  # concentric
+        ((0, 0), 1, (5, 0), 1, "disjoint"),
+    ],
+)
+def test_cases_match_reference(c0, r0, c1, r1, expected):
+    result = circle_intersections(c0, r0, c1, r1)
+    name, points = reference(c0, r0, c1, r1)
+
+    assert name == expected == case(result)
+    np.testing.assert_allclose(found(result), np.reshape(points, (-1, 2)), atol=1e-12)
+    missing = name not in ("intersecting", "tangent")
+    assert np.isnan(result.points[0, 0]).all() == missing
+
+
+@pytest.mark.parametrize(
+    "gap, expected",
+    [
+        (0.5 * EPSILON, "tangent"),
+        (-0.5 * EPSILON, "tangent"),
+        (2 * EPSILON, "disjoint"),
+        (-2 * EPSILON, "intersecting"),
+    ],
+)
+def test_eps_boundary_outside(gap, expected):
+    # Circles of radius 1 whose centers are 2 + gap apart
+    result = circle_intersections((0, 0), 1, (2 + gap, 0), 1)
+    assert case(result) == reference((0, 0), 1, (2 + gap, 0), 1)[0] == expected
+
+
+@pytest.mark.parametrize(
+    "gap, expected",
+    [
+        (0.5 * EPSILON, "tangent"),
+        (-0.5 * EPSILON, "tangent"),
+        (2 * EPSILON, "intersecting"),
+        (-2 * EPSILON, "contained"),
+    ],
+)
+def test_eps_boundary_inside(gap, expected):
+    # A radius 1 circle inside a radius 3 one, 2 + gap from its center
+    result = circle_intersections((0, 0), 3, (2 + gap, 0), 1)
+    assert case(result) == reference((0, 0), 3, (2 + gap, 0), 1)[0] == expected
+
+
+def test_eps_boundary_coincident():
+    assert case(circle_intersections((0, 0), 1, (0.5 * EPSILON, 0), 1)) == "coincident"
+    assert case(circle_intersections((0, 0), 1, (0, 0), 1 + 2 * EPSILON)) == "contained"
+
+
+def test_batched_shapes_match_reference():
+    rng = np.random.default_rng(3)
+    centers_a, radii_a = rng.uniform(-3, 3, (5, 3)), rng.uniform(0.5, 3, 5)
+    centers_b, radii_b = rng.uniform(-3, 3, (7, 3)), rng.uniform(0.5, 3, 7)
+
+    # Exact cases random circles never hit: tangent, coincident, concentric
+    centers_b[0], radii_b[0] = centers_a[0], radii_a[0]
+    centers_b[1], radii_b[1] = centers_a[1] + [radii_a[1] + 1, 0, 0], 1
+    centers_b[2] = centers_a[2]
+
+    result = circle_intersections(centers_a, radii_a, centers_b, radii_b)
+    assert result.points.shape == (5, 7, 2, 2)
+    assert result.valid.shape == (5, 7, 2)
+    for mask in (result.tangent, result.disjoint, result.contained, result.coincident):
+        assert mask.shape == (5, 7)
+
+    for i in range(5):
+        for j in range(7):
+            name, points = reference(centers_a[i], radii_a[i], centers_b[j], radii_b[j])
+            assert case(result, i, j) == name
+            np.testing.assert_allclose(
+                found(result, i, j), np.reshape(points, (-1, 2)), atol=1e-12
+            )
+
+    # Every found point is on both circles
+    for i, j, k in zip(*np.nonzero(result.valid)):
+        point = result.points[i, j, k]
+        assert np.hypot(*(point - centers_a[i, :2])) == pytest.approx(radii_a[i])
+        assert np.hypot(*(point - centers_b[j, :2])) == pytest.approx(radii_b[j])
+
+
+def test_intersect_circles_matches_reference():
+    for c0, r0, c1, r1 in [
+        ((0, 0), 1, (1, 1), 1),
+        ((0, 0), 1, (0, 2), 1),
+        ((0, 0), 1, (0, 0), 1),
+        ((0, 0, 0), 1, (9, 0, 0), 1),
+    ]:
+        expected = reference(c0, r0, c1, r1)[1]
+        np.testing.assert_allclose(
+            np.reshape(intersect_circles(c0, r0, c1, r1), (-1, 2)),
+            np.reshape(expected, (-1, 2)),
+        )
+
+
+def test_arc_intersections_matches_circles_and_batches():
+    arcs_a = [ArcGeometry((-1, 0), 1.5, 0, 2 * np.pi), ArcGeometry((9, 9), 1, 0, np.pi)]
+    arcs_b = [
+        ArcGeometry((1, 0), 1.5, 0, 2 * np.pi),
+        ArcGeometry((1, 0), 1.5, np.pi / 2, np.pi / 2),  # upper left quarter
+        ArcGeometry((-1, 0), 1.5, 0, 2 * np.pi),
+    ]
+
+    full = arc_intersections(arcs_a, arcs_b)
+    circles = circle_intersections(
+        [a.center for a in arcs_a], [a.radius for a in arcs_a],
+        [b.center for b in arcs_b], [b.radius for b in arcs_b],
+    )
+    np.testing.assert_array_equal(full.valid, circles.valid)
+    np.testing.assert_allclose(full.points, circles.points)
+    assert full.coincident[0, 2]
+
+    within = arc_intersections(arcs_a, arcs_b, within_arcs=True)
+    assert within.valid.shape == (2, 3, 2)
+    np.testing.assert_array_equal(found(within, 0, 0), found(full, 0, 0))
+    # Only the upper point is on the quarter arc
+    assert len(found(within, 0, 1)) == 1 and found(within, 0, 1)[0, 1] > 0
+    assert not within.valid[1].any()
+
+
+def on_circle(theta):
+    """The point at angle ``theta`` on the unit circle."""
+    return np.cos(theta), np.sin(theta)
+
+
+def unit_points(thetas):
+    return np.reshape([on_circle(t) for t in thetas], (-1, 2))
+
+
+@pytest.mark.parametrize(
+    "start, angle, inside, outside",
+    [
+        (0, np.pi / 2, [0.25, 1.5], [2, -0.25]),
+        (0, -np.pi / 2, [-0.25, -1.5], [0.25, 2]),  # clockwise
+        (np.pi, -np.pi, [3, 2, 0.5], [-0.5, -2]),
+        (1.5 * np.pi, np.pi, [5, 0, 1], [2, 4]),  # wraps past 2 pi
+        (-np.pi / 2, np.pi, [-1, 0, 1], [2, 4]),  # same arc, negative start
+        (2.5 * np.pi, -np.pi, [1, 0, 5], [2, 4]),  # the other way round
+        (1, 2 * np.pi, [1, 4, 7], []),  # full turn
+        (1, -4 * np.pi, [1, 4, -2], []),  # more than one
+    ],
+)
+def test_in_arc_extent(start, angle, inside, outside):
+    assert in_arc_extent(unit_points(inside), (0, 0), start, angle).all()
+    assert not in_arc_extent(unit_points(outside), (0, 0), start, angle).any()
+
+
+@pytest.mark.parametrize(
+    "start, angle", [(0.3, 1.2), (0.3, -1.2), (5.5, 1.2), (-0.3, -6)]
+)
+def test_in_arc_extent_endpoints(start, angle):
+    center = (2, -1)
+    ends = [start, start + angle, start + angle + 2 * np.pi, start - 2 * np.pi]
+    assert in_arc_extent(unit_points(ends) + center, center, start, angle).all()
+
+    # Just past either end is out
+    past = np.sign(angle) * 1e-6
+    beyond = [start - past, start + angle + past]
+    assert not in_arc_extent(unit_points(beyond) + center, center, start, angle).any()
+
+
+def test_in_arc_extent_broadcasts():
+    thetas = np.linspace(0, 2 * np.pi, 8, endpoint=False)
+    points = np.stack(on_circle(thetas), axis=-1)[:, None]  # (8, 1, 2)
+    starts = np.array([0, np.pi])  # (2,)
+    result = in_arc_extent(points, (0, 0), starts, np.pi / 2)
+    assert result.shape == (8, 2)
+    assert result[:, 0].tolist() == [True, True, True] + [False] * 5
+    assert result[:, 1].tolist() == [False] * 4 + [True, True, True, False]
+
+
+@pytest.mark.parametrize(
+    "p0, p1, center, radius, expected",
+    [
+        ((-5, 0), (5, 0), (0, 0), 2, [(-2, 0), (2, 0)]),
+        ((5, 0), (-5, 0), (0, 0), 2, [(2, 0), (-2, 0)]),  # in order along the line
+        ((-5, 2), (5, 2), (0, 0), 2, [(0, 2)]),  # tangent
+        ((-5, 2 + 0.5 * EPSILON), (5, 2), (0, 0), 2, [(0, 2)]),
+        ((-5, 3), (5, 3), (0, 0), 2, []),
+        ((1, 1), (1, 1), (0, 0), 2, []),  # no line through one point
+        # Diagonal, with 3D points
+        (
+            (0, -1, 0),
+            (1, 0, 0),
+            (1, 0, 0),
+            1,
+            [(1 - sqrt(0.5), -sqrt(0.5)), (1 + sqrt(0.5), sqrt(0.5))],
+        ),
+    ],
+)
+def test_intersect_line_circle(p0, p1, center, radius, expected):
+    points = intersect_line_circle(p0, p1, center, radius)
+    np.testing.assert_allclose(
+        np.reshape(points, (-1, 2)), np.reshape(expected, (-1, 2)), atol=1e-8
+    )
+
+
+def bezier_error(radius, start, angle, num_components):
+    """How far an arc drawn like manim's ``Arc``, with ``num_components``
+    anchors, strays from the true arc."""
+
+    pieces = num_components - 1
+    thetas = np.linspace(start, start + angle, num_components)
+    handle = 4 / 3 * np.tan(angle / pieces / 4) * radius
+    t = np.linspace(0, 1, 101)[:, None]
+
+    error = 0.0
+    for a, b in zip(thetas[:-1], thetas[1:]):
+        p0 = radius * np.array([np.cos(a), np.sin(a)])
+        p3 = radius * np.array([np.cos(b), np.sin(b)])
+        p1 = p0 + handle * np.array([-np.sin(a), np.cos(a)])
+        p2 = p3 - handle * np.array([-np.sin(b), np.cos(b)])
+        curve = (
+            (1 - t) ** 3 * p0
+            + 3 * (1 - t) ** 2 * t * p1
+            + 3 * (1 - t) * t ** 2 * p2
+            + t ** 3 * p3
+        )
+        error = max(error, np.abs(np.hypot(*curve.T) - radius).max())
+    return error
+
+
+@pytest.mark.parametrize("radius", [0.1, 2, 50])
+@pytest.mark.parametrize("angle", [0.3, -np.pi, 2 * np.pi, -0.68 * 2 * np.pi])
+@pytest.mark.parametrize("tolerance", [1e-4, 0.004, 0.5])
+def test_arc_components_stay_within_tolerance(radius, angle, tolerance):
+    count = arc_components(radius, angle, tolerance)
+    assert bezier_error(radius, 0.4, angle, count) <= tolerance
+
+    # No curve spans more than a quarter turn, and one anchor fewer would
+    # either break the tolerance or that
+    assert abs(angle) / (count - 1) <= np.pi / 2 + 1e-12
+    if count > 2:
+        fewer = count - 1
+        assert (
+            bezier_error(radius, 0.4, angle, fewer) > tolerance
+            or abs(angle) / (fewer - 1) > np.pi / 2
+        )
+
+
+def test_screen_tolerance():
+    # Half a pixel at 1080p, on the radius 2 circle of geo/scene1.py
+    camera = SimpleNamespace(frame_width=14.22, pixel_width=1920)
+    tolerance = screen_tolerance(camera, 0.5)
+    assert tolerance == pytest.approx(0.0037, abs=1e-4)
+    assert arc_components(2, 2 * np.pi, tolerance) < 9  # manim's default
+
+
+def test_arc_components_default():
+    assert arc_components(0, np.pi, 0.1) == arc_components(1, np.pi, 0) == 9
+
+
+def test_circle_points_run_counterclockwise_from_the_right():
+    points = circle_points((1, -1, 0), 2, [0, 0.25, 0.5, 0.75, 1])
+    assert points.shape == (5, 3)
+    np.testing.assert_allclose(
+        points, [(3, -1, 0), (1, 1, 0), (-1, -1, 0), (1, -3, 0), (3, -1, 0)], atol=1e-12
+    )
+    assert circle_points((0, 0), 1, 0.125).shape == (1, 3)
+
+
+def test_compass_state_points_ignore_the_arm():
+    pointing_up = CompassState(1, -1, 2, np.pi / 2)
+    np.testing.assert_allclose(
+        pointing_up.points_at([0, 0.25]), circle_points((1, -1), 2, [0, 0.25])
+    )
+    np.testing.assert_allclose(pointing_up.points_at([0.25])[0], pointing_up.arm_end)
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+pytest.importorskip("cairo")
+
+from manim import RIGHT, Circle, Dot, Scene, Square, tempconfig  # noqa: E402
+
+from rendering import layers  # noqa: E402
+from rendering.layers import layer_cached  # noqa: E402
+
+
+class MovingDot(Scene):
+    def construct(self):
+        self.add(Square(), Circle(radius=0.5))
+        dot = Dot()
+        self.play(dot.animate.shift(RIGHT))
+
+
+def render(scene_class):
+    with tempconfig({"write_to_movie": False, "quality": "low_quality"}):
+        scene = scene_class()
+        scene.render()
+    return scene
+
+
+def test_layers_draw_like_the_camera_and_fingerprint_once_per_play(monkeypatch):
+    fingerprinted = []
+
+    def counting(mobject):
+        fingerprinted.append(mobject)
+        return fingerprint(mobject)
+
+    fingerprint = layers.fingerprint
+    monkeypatch.setattr(layers, "fingerprint", counting)
+
+    plain = render(MovingDot)
+    cached = render(layer_cached(MovingDot))
+
+    np.testing.assert_allclose(
+        cached.renderer.camera.pixel_array.astype(int),
+        plain.renderer.camera.pixel_array.astype(int),
+        atol=1,  # compositing rounds premultiplied colors
+    )
+
+    # The square and circle are reused every frame, but only hashed once
+    assert cached.layer_cache.hits > 2
+    assert len(fingerprinted) <= 2
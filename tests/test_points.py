@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import Circle, PMobject  # noqa: E402
+
+from compass import Compass  # noqa: E402
+from dryrun import DryRun  # noqa: E402
+from geometry import circle_points  # noqa: E402
+
+ALPHAS = np.linspace(0, 1, 21)
+
+# point_from_proportion walks manim's Bezier circle by length, so it strays
+# from the true circle by about 1e-3 per unit of radius
+ATOL = 5e-3
+
+
+def circle_reference(center, radius, alphas):
+    circle = Circle(radius=radius).move_to([*center, 0])
+    return np.array([circle.point_from_proportion(alpha) for alpha in alphas])
+
+
+@pytest.mark.parametrize("center, radius", [((0, 0), 2), ((1.5, -0.5), 1.25)])
+def test_circle_points_match_circle(center, radius):
+    np.testing.assert_allclose(
+        circle_points(center, radius, ALPHAS),
+        circle_reference(center, radius, ALPHAS),
+        atol=ATOL,
+    )
+
+
+def test_compass_points_start_right_and_run_counterclockwise():
+    run = DryRun()
+    compass = Compass(run, center=(1.5, -0.5), radius=1.25)
+    compass.set_angle(2.0)  # where the arm points doesn't matter
+
+    expected = circle_reference((1.5, -0.5), 1.25, ALPHAS)
+    np.testing.assert_allclose(compass.points_at(ALPHAS), expected, atol=ATOL)
+
+    for alpha, point in ((0, (2.75, -0.5, 0)), (0.25, (1.5, 0.75, 0))):
+        np.testing.assert_allclose(compass.dot_at(alpha).get_center(), point, atol=1e-9)
+
+    dots = compass.dots_at(ALPHAS)
+    assert isinstance(dots, PMobject)
+    np.testing.assert_allclose(dots.points, expected, atol=ATOL)
+
+    # Each point can be snapped to
+    nearest, _ = compass.index.nearest_point((2.7, -0.5), 0.1)
+    assert nearest == pytest.approx((2.75, -0.5))
+
+
+def test_points_follow_a_timeline_plan():
+    run = DryRun()
+    compass = Compass(run, radius=1)
+    with compass.timeline():
+        compass.move_to((1, 1))
+        compass.set_radius(2)
+        dot = compass.dot_at(0.5)
+        points = compass.points_at([0, 0.75])
+
+    np.testing.assert_allclose(dot.get_center(), (-1, 1, 0), atol=1e-9)
+    expected = circle_reference((1, 1), 2, [0, 0.75])
+    np.testing.assert_allclose(points, expected, atol=ATOL)
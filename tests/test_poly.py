@@ -0,0 +1,38 @@
+import pytest
+
+from poly import Term, box_factor, box_factor_many
+
+
+def test_box_factor():
+    factoring = box_factor((28, 16, -21, -12))
+    assert factoring.row_gcds == (Term(4, 2), Term(-3, 0))
+    assert factoring.column_gcds == (Term(7, 1), Term(4, 0))
+    assert factoring.latex()["factors"] == ("(7y+4)", "(4y^2-3)")
+
+
+@pytest.mark.parametrize(
+    "coefficients, factors",
+    [
+        # Negative leading coefficient: (-4y^2 + 3)(7y + 4)
+        ((-28, -16, 21, 12), ("(7y+4)", "(-4y^2+3)")),
+        # Mixed-sign rows: (-2y^2 + 3)(3y - 2)
+        ((-6, 4, 9, -6), ("(3y-2)", "(-2y^2+3)")),
+        ((6, -4, 9, -6), ("(3y-2)", "(2y^2+3)")),
+        ((-6, 4, -9, 6), ("(3y-2)", "(-2y^2-3)")),
+    ],
+)
+def test_box_factor_signs(coefficients, factors):
+    assert box_factor(coefficients).latex()["factors"] == factors
+
+
+def test_box_factor_rejects_unfactorable():
+    with pytest.raises(ValueError):
+        box_factor((1, 1, 1, 2))
+
+
+def test_box_factor_many_matches_box_factor():
+    coefficients = [(28, 16, -21, -12), (-28, -16, 21, 12), (1, 1, 1, 2), (0, 0, 0, 0)]
+    factors = box_factor_many(coefficients)
+    assert factors.valid.tolist() == [True, True, False, False]
+    assert factors.row_coefficients[1].tolist() == [-4, 3]
+    assert factors.column_coefficients[1].tolist() == [7, 4]
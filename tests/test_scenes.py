@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("manim")
+
+from conftest import ROOT  # noqa: E402
+
+SCENE1 = "geo/scene1.py"
+PERP_BIS = "geo/compass/perp_bis.py"
+
+# Loads each scene file given, in order, in one process
+LOAD = """
+import sys
+from rendering.scenes import load_scenes
+for scene_file in sys.argv[1:]:
+    print(scene_file, *(scene.__name__ for scene in load_scenes(scene_file)))
+"""
+
+
+@pytest.mark.parametrize("scene_files", [(SCENE1, PERP_BIS), (PERP_BIS, SCENE1)])
+def test_geo_scenes_load_together(scene_files):
+    # A fresh process, so neither file finds the other's imports cached
+    result = subprocess.run(
+        [sys.executable, "-c", LOAD, *scene_files],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split("\n")[:2] == [f"{name} Main" for name in scene_files]
@@ -0,0 +1,99 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from core import arc_intersection
+from geometry import ArcGeometry, arc_bounds
+from spatial import SpatialIndex
+
+
+def random_arcs(seed, count=40):
+    rng = np.random.default_rng(seed)
+    return [
+        ArcGeometry(
+            tuple(rng.uniform(-6, 6, 2)),
+            rng.uniform(0.2, 2.5),
+            rng.uniform(-2 * np.pi, 2 * np.pi),
+            rng.uniform(-2 * np.pi, 2 * np.pi),
+        )
+        for _ in range(count)
+    ]
+
+
+def overlap(a, b):
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+@pytest.mark.parametrize("cell_size", [0.5, 1.0, 4.0])
+@pytest.mark.parametrize("seed", range(3))
+def test_candidate_pairs_match_brute_force(seed, cell_size):
+    arcs = random_arcs(seed)
+    index = SpatialIndex(cell_size)
+    for arc in arcs:
+        index.add_arc(arc)
+
+    bounds = [
+        arc_bounds(arc.center, arc.radius, arc.start_angle, arc.angle) for arc in arcs
+    ]
+    pairs = list(combinations(range(len(arcs)), 2))
+    expected = [(i, j) for i, j in pairs if overlap(bounds[i], bounds[j])]
+
+    position = {id(arc): i for i, arc in enumerate(arcs)}
+    candidates = [
+        (position[id(a)], position[id(b)]) for a, b in index.candidate_pairs()
+    ]
+    assert candidates == expected
+
+    # No pair left out actually meets
+    left_out = set(pairs) - set(candidates)
+    for i, j in left_out:
+        assert arc_intersection(None, arcs[i], arcs[j]) is None
+
+
+def test_arc_bounds_contain_the_arc():
+    for arc in random_arcs(4):
+        x_min, y_min, x_max, y_max = arc_bounds(
+            arc.center, arc.radius, arc.start_angle, arc.angle
+        )
+        thetas = arc.start_angle + np.linspace(0, arc.angle, 200)
+        xs = arc.center[0] + arc.radius * np.cos(thetas)
+        ys = arc.center[1] + arc.radius * np.sin(thetas)
+        assert x_min - 1e-9 <= xs.min() and xs.max() <= x_max + 1e-9
+        assert y_min - 1e-9 <= ys.min() and ys.max() <= y_max + 1e-9
+        # and are no bigger than it
+        assert xs.min() - x_min < 1e-3 and x_max - xs.max() < 1e-3
+
+
+def test_nearest_point():
+    index = SpatialIndex(1.0)
+    index.add_point((0.0, 0.0), "origin")
+    index.add_point((0.95, 0.0), "near the cell edge")
+    index.add_point((1.3, 0.0), "across it")
+    index.add_point(np.array([5.0, 5.0, 0.0]), "far")
+
+    assert index.nearest_point((1.1, 0.0), 0.5) == ((0.95, 0.0), "near the cell edge")
+    assert index.nearest_point((1.2, 0.0), 0.5) == ((1.3, 0.0), "across it")
+    assert index.nearest_point((0.1, 0.1), 0.5) == ((0.0, 0.0), "origin")
+    assert index.nearest_point(np.array([4.5, 5.0, 0.0]), 0.6) == ((5.0, 5.0), "far")
+
+    # Nothing within the tolerance
+    assert index.nearest_point((3.0, 3.0), 0.5) is None
+    assert index.nearest_point((1.1, 0.0), 0.1) is None
+    assert SpatialIndex().nearest_point((0, 0), 10) is None
+
+
+def test_nearest_point_matches_brute_force():
+    rng = np.random.default_rng(5)
+    points = rng.uniform(-5, 5, (300, 2))
+    index = SpatialIndex(0.7)
+    for i, point in enumerate(points):
+        index.add_point(point, i)
+
+    for query in rng.uniform(-6, 6, (200, 2)):
+        distances = np.hypot(*(points - query).T)
+        nearest = index.nearest_point(query, 0.4)
+        if distances.min() > 0.4:
+            assert nearest is None
+        else:
+            assert nearest[1] == distances.argmin()